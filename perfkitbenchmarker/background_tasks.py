@@ -84,9 +84,20 @@ _WAIT_MAX_RECHECK_DELAY = 0.050  # 50 ms
 _THREAD_STOP_PROCESSING = 0
 _THREAD_WAIT_FOR_KEYBOARD_INTERRUPT = 1
 
+# Sent to an idle child thread to hand it over to a new task manager.
+_ThreadReassignment = collections.namedtuple(
+    '_ThreadReassignment', ['worker_id', 'response_queue']
+)
+
 # The default value for max_concurrent_threads.
 MAX_CONCURRENT_THREADS = 200
 
+# Child threads left over from earlier _BackgroundThreadTaskManagers, stored as
+# (thread, task_queue) pairs. Each idle thread is blocked on its task queue and
+# can be handed to a later manager instead of starting a new Thread. A deque is
+# used because its append and pop methods are atomic and do not need a Lock.
+_idle_threads = collections.deque()
+
 # The default value is set in pkb.py. It is the greater of
 # MAX_CONCURRENT_THREADS or the value passed to --num_vms. This is particularly
 # important for the cluster_boot benchmark where we want to launch all of the
@@ -316,15 +327,17 @@ def _ExecuteBackgroundThreadTasks(worker_id, task_queue, response_queue):
     worker_id: int. Identifier for the child thread relative to other child
       threads.
     task_queue: _NonPollingSingleReaderQueue. Queue from which input is read.
-      Each value in the queue can be one of three types of values. If it is a
+      Each value in the queue can be one of four types of values. If it is a
       (task_id, _BackgroundTask) pair, the task is executed on this thread. If
-      it is _THREAD_STOP_PROCESSING, the thread stops executing. If it is
+      it is a _ThreadReassignment, the thread is handed over to another manager
+      under the new worker_id and response_queue. If it is
+      _THREAD_STOP_PROCESSING, the thread stops executing. If it is
       _THREAD_WAIT_FOR_KEYBOARD_INTERRUPT, the thread waits for a
       KeyboardInterrupt.
     response_queue: _SingleReaderQueue. Queue to which output is written. It
-      receives worker_id when this thread's bootstrap code has completed and
-      receives a (worker_id, task_id) pair for each task completed on this
-      thread.
+      receives worker_id when this thread's bootstrap or reassignment has
+      completed and receives a (worker_id, task_id) pair for each task completed
+      on this thread.
   """
   try:
     response_queue.Put(worker_id)
@@ -335,6 +348,10 @@ def _ExecuteBackgroundThreadTasks(worker_id, task_queue, response_queue):
       elif task_tuple == _THREAD_WAIT_FOR_KEYBOARD_INTERRUPT:
         while True:
           time.sleep(_WAIT_MAX_RECHECK_DELAY)
+      elif isinstance(task_tuple, _ThreadReassignment):
+        worker_id, response_queue = task_tuple
+        response_queue.Put(worker_id)
+        continue
       task_id, task = task_tuple
       task.Run()
       response_queue.Put((worker_id, task_id))
@@ -360,15 +377,20 @@ class _BackgroundThreadTaskManager(_BackgroundTaskManager):
     self._available_worker_ids = list(range(self._max_concurrency))
     uninitialized_worker_ids = set(self._available_worker_ids)
     for worker_id in self._available_worker_ids:
-      task_queue = _NonPollingSingleReaderQueue()
+      try:
+        thread, task_queue = _idle_threads.pop()
+      except IndexError:
+        task_queue = _NonPollingSingleReaderQueue()
+        thread = threading.Thread(
+            target=_ExecuteBackgroundThreadTasks,
+            args=(worker_id, task_queue, self._response_queue),
+        )
+        thread.daemon = True
+        thread.start()
+      else:
+        task_queue.Put(_ThreadReassignment(worker_id, self._response_queue))
       self._task_queues.append(task_queue)
-      thread = threading.Thread(
-          target=_ExecuteBackgroundThreadTasks,
-          args=(worker_id, task_queue, self._response_queue),
-      )
-      thread.daemon = True
       self._threads.append(thread)
-      thread.start()
     # Wait for each Thread to finish its bootstrap code. Starting all the
     # threads upfront like this and reusing them for later calls minimizes the
     # risk of a KeyboardInterrupt interfering with any of the Lock interactions.
@@ -377,11 +399,18 @@ class _BackgroundThreadTaskManager(_BackgroundTaskManager):
       uninitialized_worker_ids.remove(worker_id)
     assert not uninitialized_worker_ids, uninitialized_worker_ids
 
-  def __exit__(self, *unused_args, **unused_kwargs):
-    # Shut down worker threads.
-    for task_queue in self._task_queues:
-      task_queue.Put(_THREAD_STOP_PROCESSING)
-    for thread in self._threads:
+  def __exit__(self, exc_type, *unused_args, **unused_kwargs):
+    # Hand idle worker threads over to later managers, up to the default
+    # concurrency limit, and shut down the rest. Threads are only reused after
+    # a clean exit, since otherwise they may still be running a task.
+    stopped_threads = []
+    for thread, task_queue in zip(self._threads, self._task_queues):
+      if exc_type is None and len(_idle_threads) < MAX_CONCURRENT_THREADS:
+        _idle_threads.append((thread, task_queue))
+      else:
+        task_queue.Put(_THREAD_STOP_PROCESSING)
+        stopped_threads.append(thread)
+    for thread in stopped_threads:
       _WaitForCondition(lambda: not thread.is_alive())
 
   def StartTask(self, target, args, kwargs, thread_context):
@@ -89,6 +89,9 @@ NOT_EXCLUDED = 'permissive'
 SKIP_CHECK = 'none'
 FLAGS = flags.FLAGS
 
+# Specs hold many small objects, so read and write them in large chunks.
+_PICKLE_BUFFER_SIZE = 1 << 20
+
 flags.DEFINE_enum(
     'cloud',
     provider_info.GCP,
@@ -119,6 +122,14 @@ _ENFORCE_DISK_MOUNT_POINT_OVERRIDE = flags.DEFINE_bool(
     'Enforce the use of the --scratch_dir flag to override the default'
     ' mount_point in the disk spec.',
 )
+_VM_CONCURRENCY = flags.DEFINE_integer(
+    'vm_concurrency',
+    None,
+    'Maximum number of VMs to boot, prepare or delete concurrently. Bounding '
+    'this on large clusters avoids cloud API throttling and SSH storms. '
+    'Defaults to --max_concurrent_threads.',
+    lower_bound=1,
+)
 # pyformat: disable
 # TODO(user): Delete this flag after fulling updating gcl.
 flags.DEFINE_enum('benchmark_compatibility_checking', SUPPORTED,
@@ -576,6 +587,17 @@ class BenchmarkSpec:
     self.memory_store.SetVms(self.vm_groups)
     self.resources.append(self.memory_store)
 
+  def _FirstGroupSpecWithDiskType(self, disk_type):
+    """Returns the first VM group spec booting VMs with disk_type, or None."""
+    for group_spec in self.vms_to_boot.values():
+      if (
+          group_spec.disk_spec
+          and group_spec.vm_count
+          and group_spec.disk_spec.disk_type == disk_type
+      ):
+        return group_spec
+    return None
+
   def ConstructNfsService(self):
     """Construct the NFS service object.
 
@@ -584,28 +606,23 @@ class BenchmarkSpec:
     if self.nfs_service:
       logging.info('NFS service already created: %s', self.nfs_service)
       return
-    for group_spec in self.vms_to_boot.values():
-      if not group_spec.disk_spec or not group_spec.vm_count:
-        continue
-      disk_spec = group_spec.disk_spec
-      if disk_spec.disk_type != disk.NFS:
-        continue
-      # Choose which nfs_service to create.
-      if disk_spec.nfs_ip_address:
-        self.nfs_service = nfs_service.StaticNfsService(disk_spec)
-      elif disk_spec.nfs_managed:
-        cloud = group_spec.cloud
-        providers.LoadProvider(cloud)
-        nfs_class = nfs_service.GetNfsServiceClass(cloud)
-        self.nfs_service = nfs_class(
-            disk_spec, group_spec.vm_spec.zone
-        )  # pytype: disable=not-instantiable
-      else:
-        self.nfs_service = nfs_service.UnmanagedNfsService(
-            disk_spec, self.vms[0]
-        )
-      logging.debug('NFS service %s', self.nfs_service)
-      break
+    group_spec = self._FirstGroupSpecWithDiskType(disk.NFS)
+    if group_spec is None:
+      return
+    disk_spec = group_spec.disk_spec
+    # Choose which nfs_service to create.
+    if disk_spec.nfs_ip_address:
+      self.nfs_service = nfs_service.StaticNfsService(disk_spec)
+    elif disk_spec.nfs_managed:
+      cloud = group_spec.cloud
+      providers.LoadProvider(cloud)
+      nfs_class = nfs_service.GetNfsServiceClass(cloud)
+      self.nfs_service = nfs_class(
+          disk_spec, group_spec.vm_spec.zone
+      )  # pytype: disable=not-instantiable
+    else:
+      self.nfs_service = nfs_service.UnmanagedNfsService(disk_spec, self.vms[0])
+    logging.debug('NFS service %s', self.nfs_service)
 
   def ConstructSmbService(self):
     """Construct the SMB service object.
@@ -615,21 +632,16 @@ class BenchmarkSpec:
     if self.smb_service:
       logging.info('SMB service already created: %s', self.smb_service)
       return
-    for group_spec in self.vms_to_boot.values():
-      if not group_spec.disk_spec or not group_spec.vm_count:
-        continue
-      disk_spec = group_spec.disk_spec
-      if disk_spec.disk_type != disk.SMB:
-        continue
-
-      cloud = group_spec.cloud
-      providers.LoadProvider(cloud)
-      smb_class = smb_service.GetSmbServiceClass(cloud)
-      self.smb_service = smb_class(
-          disk_spec, group_spec.vm_spec.zone
-      )  # pytype: disable=not-instantiable
-      logging.debug('SMB service %s', self.smb_service)
-      break
+    group_spec = self._FirstGroupSpecWithDiskType(disk.SMB)
+    if group_spec is None:
+      return
+    cloud = group_spec.cloud
+    providers.LoadProvider(cloud)
+    smb_class = smb_service.GetSmbServiceClass(cloud)
+    self.smb_service = smb_class(
+        group_spec.disk_spec, group_spec.vm_spec.zone
+    )  # pytype: disable=not-instantiable
+    logging.debug('SMB service %s', self.smb_service)
 
   def ConstructVirtualMachineGroup(
       self, group_name, group_spec
@@ -641,10 +653,13 @@ class BenchmarkSpec:
 
     # First create the Static VM objects.
     if group_spec.static_vms:
+      static_vm_tags = (
+          None if FLAGS.static_vm_tags is None else set(FLAGS.static_vm_tags)
+      )
       specs = [
           spec
           for spec in group_spec.static_vms
-          if (FLAGS.static_vm_tags is None or spec.tag in FLAGS.static_vm_tags)
+          if (static_vm_tags is None or spec.tag in static_vm_tags)
       ][:vm_count]
       for vm_spec in specs:
         static_vm_class = static_vm.GetStaticVmClass(vm_spec.os_type)
@@ -669,21 +684,25 @@ class BenchmarkSpec:
           group_spec.placement_group_name
       ]
 
-    for _ in range(vm_count - len(vms)):
-      # Assign a zone to each VM sequentially from the --zones flag.
-      if FLAGS.zone:
-        zone_list = FLAGS.zone
-        group_spec.vm_spec.zone = zone_list[self._zone_index]
-        self._zone_index = (
-            self._zone_index + 1 if self._zone_index < len(zone_list) - 1 else 0
-        )
+    num_new_vms = vm_count - len(vms)
+    # The disk spec and cidr are shared by every VM in the group, so they only
+    # need to be set up once.
+    if num_new_vms > 0:
+      if disk_spec and _ENFORCE_DISK_MOUNT_POINT_OVERRIDE.value:
+        disk_spec.mount_point = FLAGS.scratch_dir
       if group_spec.cidr:  # apply cidr range to all vms in vm_group
         group_spec.vm_spec.cidr = group_spec.cidr
+
+    zone_list = FLAGS.zone
+    num_zones = len(zone_list) if zone_list else 0
+    for _ in range(num_new_vms):
+      # Assign a zone to each VM sequentially from the --zones flag.
+      if num_zones:
+        group_spec.vm_spec.zone = zone_list[self._zone_index]
+        self._zone_index = (self._zone_index + 1) % num_zones
       vm = self._CreateVirtualMachine(group_spec.vm_spec, os_type, cloud)
       vm.vm_group = group_name
       if disk_spec and not vm.is_static:
-        if _ENFORCE_DISK_MOUNT_POINT_OVERRIDE.value:
-          disk_spec.mount_point = FLAGS.scratch_dir
         vm.SetDiskSpec(disk_spec, group_spec.disk_count)
       vms.append(vm)
 
@@ -749,19 +768,20 @@ class BenchmarkSpec:
       if group_spec.os_type.startswith('juju'):
         # The Juju VM needs to be created first, so that subsequent units can
         # be properly added under its control.
+        # Controllers are tracked per cloud in clouds, so a new one is only
+        # added to self.vms when it is first constructed.
         if group_spec.cloud in clouds:
           jujuvm = clouds[group_spec.cloud]
         else:
           jujuvm = self._ConstructJujuController(group_spec)
           clouds[group_spec.cloud] = jujuvm
+          self.vms.append(jujuvm)
+          self.vm_groups['%s_juju_controller' % group_spec.cloud] = [jujuvm]
 
         for vm in vms:
-          vm.controller = clouds[group_spec.cloud]
+          vm.controller = jujuvm
 
         jujuvm.units.extend(vms)
-        if jujuvm and jujuvm not in self.vms:
-          self.vms.extend([jujuvm])
-          self.vm_groups['%s_juju_controller' % group_spec.cloud] = [jujuvm]
 
       self.vm_groups[group_name] = vms
       self.vms.extend(vms)
@@ -827,7 +847,9 @@ class BenchmarkSpec:
 
   def Prepare(self):
     targets = [(vm.PrepareBackgroundWorkload, (), {}) for vm in self.vms]
-    background_tasks.RunParallelThreads(targets, len(targets))
+    background_tasks.RunParallelThreads(
+        targets, _VM_CONCURRENCY.value or len(targets)
+    )
 
   def Provision(self):
     """Prepares the VMs and networks necessary for the benchmark to run."""
@@ -853,7 +875,7 @@ class BenchmarkSpec:
     # order based on dependencies, this key ordering can be used to avoid
     # deadlock by placing dependent networks later and their dependencies
     # earlier.
-    networks = [self.networks[key] for key in sorted(self.networks.keys())]
+    networks = [net for _, net in sorted(self.networks.items())]
 
     background_tasks.RunThreaded(lambda net: net.Create(), networks)
 
@@ -895,11 +917,16 @@ class BenchmarkSpec:
       background_tasks.RunThreaded(
           lambda vm: vm.CreateAndBoot(),
           self.vms,
+          max_concurrent_threads=_VM_CONCURRENCY.value,
           post_task_delay=FLAGS.create_and_boot_post_task_delay,
       )
       if self.nfs_service and self.nfs_service.CLOUD == nfs_service.UNMANAGED:
         self.nfs_service.Create()
-      background_tasks.RunThreaded(lambda vm: vm.PrepareAfterBoot(), self.vms)
+      background_tasks.RunThreaded(
+          lambda vm: vm.PrepareAfterBoot(),
+          self.vms,
+          max_concurrent_threads=_VM_CONCURRENCY.value,
+      )
 
       sshable_vms = [
           vm for vm in self.vms if vm.OS_TYPE not in os_types.WINDOWS_OS_TYPES
@@ -1015,9 +1042,15 @@ class BenchmarkSpec:
     if self.vms:
       try:
         # Delete VMs first to detach any multi-attached disks.
-        background_tasks.RunThreaded(self.DeleteVm, self.vms)
         background_tasks.RunThreaded(
-            lambda vm: vm.DeleteScratchDisks(), self.vms
+            self.DeleteVm,
+            self.vms,
+            max_concurrent_threads=_VM_CONCURRENCY.value,
+        )
+        background_tasks.RunThreaded(
+            lambda vm: vm.DeleteScratchDisks(),
+            self.vms,
+            max_concurrent_threads=_VM_CONCURRENCY.value,
         )
       except Exception:
         logging.exception(
@@ -1028,9 +1061,12 @@ class BenchmarkSpec:
       for placement_group_object in self.placement_groups.values():
         placement_group_object.Delete()
 
-    for firewall in self.firewalls.values():
+    if self.firewalls:
       try:
-        firewall.DisallowAllPorts()
+        background_tasks.RunThreaded(
+            lambda firewall: firewall.DisallowAllPorts(),
+            list(self.firewalls.values()),
+        )
       except Exception:
         logging.exception(
             'Got an exception disabling firewalls. '
@@ -1042,6 +1078,9 @@ class BenchmarkSpec:
       self.container_cluster.DeleteContainers()
       self.container_cluster.Delete()
 
+    # Networks are deleted one at a time because some share resources, such as
+    # a VPC peering between two AWS networks, that only the first Delete may
+    # tear down.
     for net in self.networks.values():
       try:
         net.Delete()
@@ -1184,9 +1223,11 @@ class BenchmarkSpec:
   def Pickle(self, filename=None):
     """Pickles the spec so that it can be unpickled on a subsequent run."""
     with open(
-        filename or self._GetPickleFilename(self.uid), 'wb'
+        filename or self._GetPickleFilename(self.uid),
+        'wb',
+        buffering=_PICKLE_BUFFER_SIZE,
     ) as pickle_file:
-      pickle.dump(self, pickle_file, 2)
+      pickle.dump(self, pickle_file, pickle.HIGHEST_PROTOCOL)
 
   def Freeze(self):
     """Pickles the spec to a destination, defaulting to tempdir if not found."""
@@ -1221,7 +1262,9 @@ class BenchmarkSpec:
       return cls(benchmark_module, config, uid)
 
     try:
-      with open(cls._GetPickleFilename(uid), 'rb') as pickle_file:
+      with open(
+          cls._GetPickleFilename(uid), 'rb', buffering=_PICKLE_BUFFER_SIZE
+      ) as pickle_file:
         bm_spec = pickle.load(pickle_file)
     except Exception as e:  # pylint: disable=broad-except
       logging.error(
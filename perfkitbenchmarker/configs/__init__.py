@@ -179,18 +179,37 @@ def _LoadConfigConstants():
     return fp.read()
 
 
+@functools.lru_cache(maxsize=None)
+def _ParseBenchmarkConfig(benchmark_config):
+  """Parses a benchmark config prepended with the config constants.
+
+  Every copy of a benchmark in a flag matrix or zip shares the same default
+  config string, so the YAML parse is only done once per string. The cache is
+  unbounded so that the parses done for every benchmark while building the
+  --help text are reused when the selected benchmarks load their configs.
+  Callers must not modify the returned object.
+
+  Args:
+    benchmark_config: str. The default config in YAML format.
+
+  Returns:
+    The parsed YAML document.
+  """
+  return yaml.safe_load('\n'.join([_LoadConfigConstants(), benchmark_config]))
+
+
 def _GetConfigFromOverrides(overrides):
   """Converts a list of overrides into a config."""
   config = {}
 
   for override in overrides:
-    if override.count('=') != 1:
+    # Only the first "=" separates the key, so values may contain "=".
+    full_key, separator, value = override.partition('=')
+    if not separator:
       raise ValueError(
-          '--config_override flag value has incorrect number of '
-          '"=" characters. The value must take the form '
-          'fully.qualified.key=value.'
+          '--config_override flag value has no "=" character. The value must '
+          'take the form fully.qualified.key=value.'
       )
-    full_key, value = override.split('=')
     keys = full_key.split('.')
     new_config = {keys.pop(): yaml.safe_load(value)}
     while keys:
@@ -306,12 +325,8 @@ def LoadMinimalConfig(benchmark_config, benchmark_name):
   Returns:
     dict. The loaded config.
   """
-  yaml_config = []
-  yaml_config.append(_LoadConfigConstants())
-  yaml_config.append(benchmark_config)
-
   try:
-    config = yaml.safe_load('\n'.join(yaml_config))
+    config = _ParseBenchmarkConfig(benchmark_config)
   except yaml.parser.ParserError as e:
     raise errors.Config.ParseError(
         'Encountered a problem loading the default benchmark config. Please '
@@ -154,7 +154,7 @@ class DiskIOPSToCapacity:
     Raises:
       InvalidProviderError: Incorrect provider type given.
     """
-    if self._provider not in list(CLOUD_PROVIDERS_INFO.keys()):
+    if self._provider not in CLOUD_PROVIDERS_INFO:
       raise InvalidProviderError(
           'Provider given is not supported by storage_utility.'
       )
@@ -445,9 +445,6 @@ class PrepareScratchDiskStrategy:
     vm.RunDiskpartScript(script)
 
     # Grant user permissions on the drive
-    vm.RemoteCommand(
-        'icacls {}: /grant Users:F /L'.format(vm.assigned_disk_letter)
-    )
     vm.RemoteCommand(
         'icacls {}: --% /grant Users:(OI)(CI)F /L'.format(
             vm.assigned_disk_letter
@@ -528,9 +525,6 @@ class PrepareScratchDiskStrategy:
     vm.RunDiskpartScript(script)
 
     # Grant user permissions on the drive
-    vm.RemoteCommand(
-        'icacls {}: /grant Users:F /L'.format(self.TEMPDB_DISK_LETTER)
-    )
     vm.RemoteCommand(
         'icacls {}: --% /grant Users:(OI)(CI)F /L'.format(
             self.TEMPDB_DISK_LETTER
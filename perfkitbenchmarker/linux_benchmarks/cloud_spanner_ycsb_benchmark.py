@@ -88,6 +88,21 @@ flags.DEFINE_list(
     'VM during the installation phase.',
 )
 
+# YCSB cloudspanner properties that are passed through from flags, as
+# (property, flag name) pairs.
+_RUN_KWARG_FLAGS = (
+    ('cloudspanner.readmode', 'cloud_spanner_ycsb_readmode'),
+    ('cloudspanner.boundedstaleness', 'cloud_spanner_ycsb_boundedstaleness'),
+    ('cloudspanner.batchinserts', 'cloud_spanner_ycsb_batchinserts'),
+)
+
+_SCHEMA_TEMPLATE = """
+  CREATE TABLE {table} (
+    id     STRING(MAX),
+    {fields}
+  ) PRIMARY KEY(id)
+  """
+
 
 def GetConfig(user_config):
   config = configs.LoadConfig(BENCHMARK_CONFIG, user_config, BENCHMARK_NAME)
@@ -168,12 +183,10 @@ def Run(benchmark_spec):
       'zeropadding': BENCHMARK_ZERO_PADDING,
       'cloudspanner.instance': spanner.instance_id,
       'cloudspanner.database': spanner.database,
-      'cloudspanner.readmode': FLAGS.cloud_spanner_ycsb_readmode,
-      'cloudspanner.boundedstaleness': (
-          FLAGS.cloud_spanner_ycsb_boundedstaleness
-      ),
-      'cloudspanner.batchinserts': FLAGS.cloud_spanner_ycsb_batchinserts,
   }
+  run_kwargs.update(
+      {prop: FLAGS[flag_name].value for prop, flag_name in _RUN_KWARG_FLAGS}
+  )
   # Uses overridden cloud spanner endpoint in gcloud configuration
   end_point = spanner.GetApiEndPoint()
   if end_point:
@@ -212,14 +225,9 @@ def _BuildSchema():
     A string of DDL for creating a Spanner table.
   """
   fields = ',\n'.join(
-      [f'field{i} STRING(MAX)' for i in range(FLAGS.ycsb_field_count)]
+      f'field{i} STRING(MAX)' for i in range(FLAGS.ycsb_field_count)
   )
-  return f"""
-  CREATE TABLE {BENCHMARK_TABLE} (
-    id     STRING(MAX),
-    {fields}
-  ) PRIMARY KEY(id)
-  """
+  return _SCHEMA_TEMPLATE.format(table=BENCHMARK_TABLE, fields=fields)
 
 
 def _Install(vm):
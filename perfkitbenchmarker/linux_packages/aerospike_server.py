@@ -185,8 +185,9 @@ def _InstallFromPackage(vm):
 def _Install(vm):
   """Installs the Aerospike server on the VM."""
   vm.Install('build_tools')
-  vm.Install('lua5_1')
-  vm.Install('openssl')
+  with vm.BatchInstallPackages():
+    vm.Install('lua5_1')
+    vm.Install('openssl')
   vm.Install('wget')
   if _AEROSPIKE_EDITION.value == AerospikeEdition.COMNUNITY:
     _InstallFromGit(vm)
@@ -18,9 +18,9 @@
 
 def YumInstall(vm):
   """Installs lua on the VM."""
-  vm.InstallPackages('lua lua-devel')
+  vm.QueueInstallPackages('lua lua-devel')
 
 
 def AptInstall(vm):
   """Installs lua on the VM."""
-  vm.InstallPackages('lua5.1 liblua5.1-dev')
+  vm.QueueInstallPackages('lua5.1 liblua5.1-dev')
@@ -18,12 +18,12 @@
 
 def YumInstall(vm):
   """Installs OpenSSL on the VM."""
-  vm.InstallPackages('openssl openssl-devel')
+  vm.QueueInstallPackages('openssl openssl-devel')
 
 
 def AptInstall(vm):
   """Installs OpenSSL on the VM."""
-  vm.InstallPackages('openssl libssl-dev')
+  vm.QueueInstallPackages('openssl libssl-dev')
 
 
 def AptInstallQAT(vm):
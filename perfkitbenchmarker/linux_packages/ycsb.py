@@ -43,6 +43,7 @@ import logging
 import os
 import posixpath
 import re
+import threading
 import time
 from typing import Any
 from absl import flags
@@ -95,6 +96,12 @@ _YCSB_BINDING = flags.DEFINE_string(
     'Must be used with --ycsb_commit. If supplied, builds YCSB only with the'
     ' specified binding in order to speed up the build.',
 )
+_YCSB_PUSH_TAR_FROM_RUNNER = flags.DEFINE_boolean(
+    'ycsb_push_tar_from_runner',
+    False,
+    'If true, download the YCSB tarball once on the PKB runner and push it to'
+    ' each client VM, instead of downloading it separately on every VM.',
+)
 flags.DEFINE_enum(
     'ycsb_measurement_type',
     ycsb_stats.HISTOGRAM,
@@ -528,6 +535,23 @@ def SetYcsbTarUrl(url):
   _ycsb_tar_url = url
 
 
+# Local copies of YCSB tarballs downloaded on the runner, keyed by URL.
+_runner_tar_paths: dict[str, str] = {}
+_runner_tar_lock = threading.Lock()
+
+
+def _DownloadTarToRunner(url: str) -> str:
+  """Downloads url to the run's temp dir once and returns the local path."""
+  with _runner_tar_lock:
+    if url not in _runner_tar_paths:
+      local_path = os.path.join(
+          vm_util.GetTempDir(), f'ycsb-{len(_runner_tar_paths)}.tar.gz'
+      )
+      vm_util.IssueCommand(['curl', '-fsSL', '-o', local_path, url])
+      _runner_tar_paths[url] = local_path
+    return _runner_tar_paths[url]
+
+
 def _GetVersion(version_str: str) -> int:
   """Returns the version from ycsb version string.
 
@@ -697,17 +721,17 @@ def Install(vm):
   # ycsb.py uses /usr/bin/env python
   vm.RemoteCommand('sudo ln -sf /usr/bin/python2.7 /usr/local/bin/python')
   vm.Install('maven')
+  # Log4j 2 < 2.16 is vulnerable to
+  # https://cve.mitre.org/cgi-bin/cvename.cgi?name=CVE-2021-44228.
+  # YCSB currently ships with a number of vulnerable jars. None are used by
+  # PKB, so simply exclude them.
+  # After https://github.com/brianfrankcooper/YCSB/pull/1583 is merged and
+  # released, this will not be necessary.
+  # TODO(user): Update minimum YCSB version and remove.
+  log4j_exclude = "--exclude='**/log4j-core-2*.jar' "
   install_cmd = (
       'mkdir -p {0} && curl -L {1} | '
-      'tar -C {0} --strip-components=1 -xzf - '
-      # Log4j 2 < 2.16 is vulnerable to
-      # https://cve.mitre.org/cgi-bin/cvename.cgi?name=CVE-2021-44228.
-      # YCSB currently ships with a number of vulnerable jars. None are used by
-      # PKB, so simply exclude them.
-      # After https://github.com/brianfrankcooper/YCSB/pull/1583 is merged and
-      # released, this will not be necessary.
-      # TODO(user): Update minimum YCSB version and remove.
-      "--exclude='**/log4j-core-2*.jar' "
+      'tar -C {0} --strip-components=1 -xzf - ' + log4j_exclude
   )
   if _YCSB_COMMIT.value:
     vm.RemoteCommand(
@@ -727,7 +751,15 @@ def Install(vm):
         or FLAGS.ycsb_tar_url
         or YCSB_URL_TEMPLATE.format(_YCSB_VERSION.value)
     )
-    vm.RemoteCommand(install_cmd.format(YCSB_DIR, ycsb_url))
+    if _YCSB_PUSH_TAR_FROM_RUNNER.value:
+      remote_tar = posixpath.join(vm_util.VM_TMP_DIR, 'ycsb.tar.gz')
+      vm.PushFile(_DownloadTarToRunner(ycsb_url), remote_tar)
+      vm.RemoteCommand(
+          f'mkdir -p {YCSB_DIR} && tar -C {YCSB_DIR} --strip-components=1 '
+          f'-xzf {remote_tar} {log4j_exclude}'
+      )
+    else:
+      vm.RemoteCommand(install_cmd.format(YCSB_DIR, ycsb_url))
   vm.RemoteCommand(install_cmd.format(HDRHISTOGRAM_DIR, HDRHISTOGRAM_TAR_URL))
   # _JAVA_OPTIONS needed to work around this issue:
   # https://stackoverflow.com/questions/53010200/maven-surefire-could-not-find-forkedbooter-class
@@ -28,6 +28,7 @@ for you.
 
 import abc
 import collections
+import contextlib
 import copy
 import json
 import logging
@@ -431,6 +432,10 @@ class BaseLinuxMixin(os_mixin.BaseOsMixin):
   # TODO(spencerkim): Record ib device metadata.
   _IGNORE_NETWORK_DEVICE_PREFIXES = ('lo', 'docker', 'ib')
 
+  # Packages deferred by QueueInstallPackages while a BatchInstallPackages
+  # block is open. None when no batch is open.
+  _queued_packages: list[str] | None = None
+
   def __init__(self, *args, **kwargs):
     super().__init__(*args, **kwargs)
     # N.B. If you override ssh_port you must override remote_access_ports and
@@ -2128,6 +2133,61 @@ class BaseLinuxMixin(os_mixin.BaseOsMixin):
     """Installs packages using the OS's package manager."""
     pass
 
+  def QueueInstallPackages(self, packages: str) -> None:
+    """Installs packages, deferring them while a batch is open.
+
+    Inside a BatchInstallPackages() block the packages are queued and installed
+    together when the block exits. Otherwise they are installed immediately.
+
+    Args:
+      packages: Space separated names of OS packages to install.
+    """
+    if self._queued_packages is None:
+      self.InstallPackages(packages)
+      return
+    for package in packages.split():
+      if package not in self._queued_packages:
+        self._queued_packages.append(package)
+
+  def FlushInstallPackages(self) -> None:
+    """Installs all queued packages with a single package manager call."""
+    if self._queued_packages:
+      packages = ' '.join(self._queued_packages)
+      self._queued_packages = []
+      self.InstallPackages(packages)
+
+  @contextlib.contextmanager
+  def BatchInstallPackages(self):
+    """Coalesces QueueInstallPackages calls into one package manager call.
+
+    Each package manager call is an SSH round trip and takes the apt/yum lock,
+    so installing several simple PerfKit packages back to back is cheaper when
+    their OS packages are installed together, e.g.
+
+      with vm.BatchInstallPackages():
+        vm.Install('lua5_1')
+        vm.Install('openssl')
+
+    Yields:
+      None. Queued packages are installed when the block exits without error.
+    """
+    if self._queued_packages is not None:
+      # Already batching; the outermost block flushes.
+      yield
+      return
+    installed_before = set(self._installed_packages)
+    self._queued_packages = []
+    try:
+      yield
+      self.FlushInstallPackages()
+    except BaseException:
+      # Install() marks a package installed as soon as its OS packages are
+      # queued. Unmark them so a retry installs them again.
+      self._installed_packages.intersection_update(installed_before)
+      raise
+    finally:
+      self._queued_packages = None
+
   def _IsSmtEnabled(self):
     """Whether simultaneous multithreading (SMT) is enabled on the vm.
 
@@ -88,6 +88,24 @@ class BaseFirewall:
     """
     pass
 
+  def AllowPorts(self, vm, ports, source_range=None):
+    """Opens several individual ports on the firewall.
+
+    Providers that can open a list of ports with a single rule or API call
+    should override this. By default each port is opened separately.
+
+    Args:
+      vm: The BaseVirtualMachine object to open the ports for.
+      ports: Iterable of ports to open.
+      source_range: List of source CIDRs to allow for these ports. If None, all
+        sources are allowed.
+    """
+    for port in ports:
+      if source_range:
+        self.AllowPort(vm, port, source_range=source_range)
+      else:
+        self.AllowPort(vm, port)
+
   def DisallowAllPorts(self):
     """Closes all ports on the firewall."""
     pass
@@ -1680,9 +1680,13 @@ def RunBenchmarks():
 def _GenerateBenchmarkDocumentation():
   """Generates benchmark documentation to show in --help."""
   benchmark_docs = []
-  for benchmark_module in (
-      linux_benchmarks.BENCHMARKS + windows_benchmarks.BENCHMARKS
-  ):
+  benchmark_modules = [
+      (benchmark_module, '') for benchmark_module in linux_benchmarks.BENCHMARKS
+  ] + [
+      (benchmark_module, ' (Windows)')
+      for benchmark_module in windows_benchmarks.BENCHMARKS
+  ]
+  for benchmark_module, name_suffix in benchmark_modules:
     benchmark_config = configs.LoadMinimalConfig(
         benchmark_module.BENCHMARK_CONFIG, benchmark_module.BENCHMARK_NAME
     )
@@ -1699,9 +1703,7 @@ def _GenerateBenchmarkDocumentation():
       if group.get('disk_spec'):
         scratch_disk_str = ' with scratch volume(s)'
 
-    name = benchmark_module.BENCHMARK_NAME
-    if benchmark_module in windows_benchmarks.BENCHMARKS:
-      name += ' (Windows)'
+    name = benchmark_module.BENCHMARK_NAME + name_suffix
     benchmark_docs.append(
         '%s: %s (%s VMs%s)'
         % (
@@ -1877,6 +1879,8 @@ def Main():
   """Entrypoint for PerfKitBenchmarker."""
   assert sys.version_info >= (3, 11), 'PerfKitBenchmarker requires Python 3.11+'
   log_util.ConfigureBasicLogging()
-  _InjectBenchmarkInfoIntoDocumentation()
+  # Parse first so that --version exits before loading every benchmark config
+  # to build the help text.
   ParseArgs()
+  _InjectBenchmarkInfoIntoDocumentation()
   return RunBenchmarks()
@@ -483,9 +483,8 @@ class AliCloudKeyFileManager:
 
   @classmethod
   def GetPublicKey(cls):
-    cat_cmd = ['cat', vm_util.GetPublicKeyPath()]
-    keyfile, _ = vm_util.IssueRetryableCommand(cat_cmd)
-    return keyfile.strip()
+    with open(vm_util.GetPublicKeyPath()) as f:
+      return f.read().strip()
 
 
 class Debian113BasedAliVirtualMachine(
@@ -16,7 +16,6 @@
 This module abstract out the disk algorithm for formatting and creating
 scratch disks.
 """
-import collections
 import logging
 import time
 from typing import Any
@@ -71,7 +70,7 @@ class CreateLocalDiskStrategy(AWSCreateDiskStrategy):
       if not self.vm.DiskTypeCreatedOnVMCreation(disk_spec.disk_type):
         continue
       for i in range(self.vm.max_local_disks):
-        mapping = collections.OrderedDict()
+        mapping = {}
         device_letter = aws_disk.AwsDisk.GenerateDeviceLetter(self.vm.name)
         device_name_prefix = aws_disk.AwsDisk.GenerateDeviceNamePrefix()
         device_name = device_name_prefix + device_letter
@@ -140,12 +139,12 @@ class CreateRemoteDiskStrategy(AWSCreateDiskStrategy):
       if not self.vm.DiskTypeCreatedOnVMCreation(disk_spec.disk_type):
         continue
       for i in range(disk_spec.num_striped_disks):
-        mapping = collections.OrderedDict()
+        mapping = {}
         device_letter = aws_disk.AwsDisk.GenerateDeviceLetter(self.vm.name)
         device_name_prefix = aws_disk.AwsDisk.GenerateDeviceNamePrefix()
         device_name = device_name_prefix + device_letter
         mapping['DeviceName'] = device_name
-        ebs_block = collections.OrderedDict()
+        ebs_block = {}
         ebs_block['VolumeType'] = disk_spec.disk_type
         ebs_block['VolumeSize'] = disk_spec.disk_size
         ebs_block['DeleteOnTermination'] = True
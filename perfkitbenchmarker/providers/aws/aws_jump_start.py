@@ -7,7 +7,6 @@ One time step:
 https://docs.aws.amazon.com/sagemaker/latest/dg/sagemaker-geospatial-roles-create-execution-role.html
 """
 
-import json
 import logging
 import re
 from typing import Any
@@ -27,6 +26,11 @@ EXECUTION_ARN_BASE = 'arn:aws:iam::{account_number}:role/sagemaker-full-access'
 # File located at google3/third_party/py/perfkitbenchmarker/scripts/
 AWS_RUNNER_SCRIPT = 'aws_jump_start_runner.py'
 
+# Patterns matched against the runner script's stdout.
+_RESPONSE_RE = re.compile(r'Response>>>>(.*)====', flags=re.DOTALL)
+_ENDPOINT_NAME_RE = re.compile(r'Endpoint name: <(.+?)>')
+_MODEL_NAME_RE = re.compile(r'Model name: <(.+?)>')
+
 
 class JumpStartModelInRegistry(managed_ai_model.BaseManagedAiModel):
   """Represents a Vertex AI model in the model registry.
@@ -92,15 +96,17 @@ class JumpStartModelInRegistry(managed_ai_model.BaseManagedAiModel):
     """Returns list of endpoint names."""
     if region is None:
       region = self.region
-    out, _, _ = self.vm.RunCommand(
-        ['aws', 'sagemaker', 'list-endpoints', f'--region={region}']
-    )
-    out_json = json.loads(out)
-    json_endpoints = out_json['Endpoints']
-    endpoints = []
-    for json_endpoint in json_endpoints:
-      endpoints.append(json_endpoint['EndpointName'])
-    return endpoints
+    # Let the CLI project out the names rather than parsing the full JSON.
+    # Endpoint names cannot contain whitespace.
+    out, _, _ = self.vm.RunCommand([
+        'aws',
+        'sagemaker',
+        'list-endpoints',
+        f'--region={region}',
+        '--query=Endpoints[].EndpointName',
+        '--output=text',
+    ])
+    return out.split()
 
   def _RunPythonScript(self, args: list[str]) -> tuple[str, str]:
     """Calls the on-client-vm python script with appropriate arguments.
@@ -144,7 +150,7 @@ class JumpStartModelInRegistry(managed_ai_model.BaseManagedAiModel):
         f'--max_tokens={max_tokens}',
         f'--temperature={temperature}',
     ])
-    matches = re.search('Response>>>>(.*)====', out, flags=re.DOTALL)
+    matches = _RESPONSE_RE.search(out)
     if not matches:
       raise errors.Resource.GetError(
           'Could not find response in endpoint call stdout.\nStdout:'
@@ -172,9 +178,11 @@ class JumpStartModelInRegistry(managed_ai_model.BaseManagedAiModel):
 
     # TODO(user): Handle errors rather than swallowing them.
     # Unfortunately even a correct run gives some errors.
-    def _FindNameMatch(out: str, resource_type: str) -> str:
+    def _FindNameMatch(
+        out: str, pattern: re.Pattern[str], resource_type: str
+    ) -> str:
       """Finds the name of the resource in the output of the python script."""
-      matches = re.search(f'{resource_type}: <(.+?)>', out)
+      matches = pattern.search(out)
       if not matches:
         raise errors.Resource.CreationError(
             f'Could not find {resource_type} in python create output.\nStdout:'
@@ -182,8 +190,8 @@ class JumpStartModelInRegistry(managed_ai_model.BaseManagedAiModel):
         )
       return matches.group(1)
 
-    self.endpoint_name = _FindNameMatch(out, 'Endpoint name')
-    self.model_name = _FindNameMatch(out, 'Model name')
+    self.endpoint_name = _FindNameMatch(out, _ENDPOINT_NAME_RE, 'Endpoint name')
+    self.model_name = _FindNameMatch(out, _MODEL_NAME_RE, 'Model name')
 
   def _PostCreate(self) -> None:
     """Adds tags after creation timing."""
@@ -201,17 +209,38 @@ class JumpStartModelInRegistry(managed_ai_model.BaseManagedAiModel):
     self.vm.RunCommand(cmd)
 
   def _CreateDependencies(self) -> None:
-    self.vm.Install('pip')
+    # Installed as packages so that models sharing a client VM only install
+    # their dependencies once.
     self.vm.Install('awscli')
-    self.vm.RunCommand('pip install sagemaker')
-    self.vm.RunCommand('pip install absl-py')
+    self.vm.Install('sagemaker')
     self.python_script = self.vm.PrepareResourcePath(AWS_RUNNER_SCRIPT)
 
   def _Delete(self) -> None:
     """Deletes the underlying resource."""
     assert self.endpoint_name
-    self._RunPythonScript(
-        ['--operation=delete', f'--endpoint_name={self.endpoint_name}']
+    # Call the AWS CLI directly rather than the runner script, which spends
+    # seconds importing the sagemaker SDK to make the same calls. As with the
+    # script, failures are logged but not raised.
+    endpoint_flag = f'--endpoint-name={self.endpoint_name}'
+    config_name, _, _ = self._RunSagemakerCommand(
+        'describe-endpoint',
+        endpoint_flag,
+        '--query=EndpointConfigName',
+        '--output=text',
+    )
+    self._RunSagemakerCommand('delete-model', f'--model-name={self.model_name}')
+    self._RunSagemakerCommand('delete-endpoint', endpoint_flag)
+    config_name = config_name.strip()
+    if config_name:
+      self._RunSagemakerCommand(
+          'delete-endpoint-config', f'--endpoint-config-name={config_name}'
+      )
+
+  def _RunSagemakerCommand(self, operation: str, *args: str):
+    """Runs an aws sagemaker CLI operation, ignoring failures."""
+    return self.vm.RunCommand(
+        ['aws', 'sagemaker', operation, *args, f'--region={self.region}'],
+        ignore_failure=True,
     )
 
 
@@ -52,7 +52,7 @@ FLAGS = flags.FLAGS
 
 HVM = 'hvm'
 PV = 'paravirtual'
-NON_HVM_PREFIXES = ['m1', 'c1', 't1', 'm2']
+NON_HVM_PREFIXES = frozenset(['m1', 'c1', 't1', 'm2'])
 
 # AWS EC2 Instance life cycle:
 # https://docs.aws.amazon.com/AWSEC2/latest/UserGuide/ec2-instance-lifecycle.html
@@ -161,6 +161,18 @@ _EFA_V2_MACHINE_TYPES = (
 
 _UNSUPPORTED = 'Unsupported'
 
+# Windows AMIs normally publish password data within 15 minutes of boot. AMIs
+# that do not generate a password never publish it, so give up eventually.
+_PASSWORD_DATA_TIMEOUT = 30 * 60
+
+# describe-images output keyed by the full command. Each command has its own
+# lock so that concurrently created VMs share one call per distinct query.
+_describe_images_output: dict[tuple[str, ...], str] = {}
+_describe_images_locks: dict[tuple[str, ...], threading.Lock] = (
+    collections.defaultdict(threading.Lock)
+)
+_describe_images_locks_lock = threading.Lock()
+
 
 class AwsTransitionalVmRetryableError(Exception):
   """Error for retrying _Exists when an AWS VM is in a transitional state."""
@@ -186,6 +198,27 @@ class AwsImageNotFoundError(Exception):
   """Error indicating no appropriate AMI could be found."""
 
 
+def _IssueDescribeImagesCommand(describe_cmd: list[str]) -> str:
+  """Runs an 'ec2 describe-images' command, reusing earlier output.
+
+  Args:
+    describe_cmd: The full describe-images command line.
+
+  Returns:
+    The command's stdout. Empty output is returned but not cached.
+  """
+  cache_key = tuple(describe_cmd)
+  with _describe_images_locks_lock:
+    lock = _describe_images_locks[cache_key]
+  with lock:
+    stdout = _describe_images_output.get(cache_key)
+    if stdout is None:
+      stdout, _ = util.IssueRetryableCommand(describe_cmd)
+      if stdout:
+        _describe_images_output[cache_key] = stdout
+  return stdout
+
+
 def GetRootBlockDeviceSpecForImage(image_id, region):
   """Queries the CLI and returns the root block device specification as a dict.
 
@@ -206,7 +239,7 @@ def GetRootBlockDeviceSpecForImage(image_id, region):
       '--query',
       'Images[]',
   ]
-  stdout, _ = util.IssueRetryableCommand(command)
+  stdout = _IssueDescribeImagesCommand(command)
   images = json.loads(stdout)
   assert images
   assert len(images) == 1, (
@@ -426,17 +459,25 @@ class AwsKeyFileManager:
   """Object for managing AWS Keyfiles."""
 
   _lock = threading.Lock()
+  # Keyfile operations in different regions are independent.
+  _region_locks = collections.defaultdict(threading.Lock)
   imported_keyfile_set = set()
   deleted_keyfile_set = set()
 
+  @classmethod
+  def _GetRegionLock(cls, region) -> threading.Lock:
+    """Returns the lock for keyfile operations in the given region."""
+    with cls._lock:
+      return cls._region_locks[region]
+
   @classmethod
   def ImportKeyfile(cls, region):
     """Imports the public keyfile to AWS."""
-    with cls._lock:
+    with cls._GetRegionLock(region):
       if _GetKeyfileSetKey(region) in cls.imported_keyfile_set:
         return
-      cat_cmd = ['cat', vm_util.GetPublicKeyPath()]
-      keyfile, _ = vm_util.IssueRetryableCommand(cat_cmd)
+      with open(vm_util.GetPublicKeyPath()) as f:
+        keyfile = f.read()
       formatted_tags = util.FormatTagSpecifications(
           'key-pair', util.MakeDefaultTags()
       )
@@ -466,7 +507,7 @@ class AwsKeyFileManager:
   @classmethod
   def DeleteKeyfile(cls, region):
     """Deletes the imported keyfile for a region."""
-    with cls._lock:
+    with cls._GetRegionLock(region):
       if _GetKeyfileSetKey(region) in cls.deleted_keyfile_set:
         return
       delete_cmd = util.AWS_PREFIX + [
@@ -535,6 +576,9 @@ class AwsVirtualMachine(virtual_machine.BaseVirtualMachine):
   _lock = threading.Lock()
   deleted_hosts = set()
   host_map = collections.defaultdict(list)
+  # Guard each host_map entry, so that creating a dedicated host for one
+  # machine type and zone does not block VMs using other hosts.
+  _host_locks = collections.defaultdict(threading.Lock)
   machine_type: str
 
   def __init__(self, vm_spec):
@@ -642,6 +686,12 @@ class AwsVirtualMachine(virtual_machine.BaseVirtualMachine):
     """Returns the list of hosts that are compatible with this VM."""
     return self.host_map[(self.machine_type, self.zone)]
 
+  @property
+  def _host_lock(self) -> threading.Lock:
+    """Returns the lock guarding host_list."""
+    with self._lock:
+      return self._host_locks[(self.machine_type, self.zone)]
+
   @property
   def group_id(self):
     """Returns the security group ID of this VM."""
@@ -744,7 +794,7 @@ class AwsVirtualMachine(virtual_machine.BaseVirtualMachine):
       # This is the default, but be explicit.
       describe_cmd.append('--no-include-deprecated')
     describe_cmd.extend(['--owners'] + cls.IMAGE_OWNER)
-    stdout, _ = util.IssueRetryableCommand(describe_cmd)
+    stdout = _IssueDescribeImagesCommand(describe_cmd)
 
     if not stdout:
       raise AwsImageNotFoundError(
@@ -1022,8 +1072,8 @@ class AwsVirtualMachine(virtual_machine.BaseVirtualMachine):
           % self.capacity_reservation_id
       )
     if self.use_spot_instance:
-      instance_market_options = collections.OrderedDict()
-      spot_options = collections.OrderedDict()
+      instance_market_options = {}
+      spot_options = {}
       spot_options['SpotInstanceType'] = 'one-time'
       spot_options['InstanceInterruptionBehavior'] = 'terminate'
       if self.spot_price:
@@ -1049,7 +1099,7 @@ class AwsVirtualMachine(virtual_machine.BaseVirtualMachine):
     self.AllowRemoteAccessPorts()
 
     if self.use_dedicated_host:
-      with self._lock:
+      with self._host_lock:
         if not self.host_list or (
             self.num_vms_per_host
             and self.host_list[-1].fill_fraction + 1.0 / self.num_vms_per_host
@@ -1068,7 +1118,7 @@ class AwsVirtualMachine(virtual_machine.BaseVirtualMachine):
     """Delete VM dependencies."""
     AwsKeyFileManager.DeleteKeyfile(self.region)
     if self.host:
-      with self._lock:
+      with self._host_lock:
         if self.host in self.host_list:
           self.host_list.remove(self.host)
         if self.host not in self.deleted_hosts:
@@ -1077,6 +1127,12 @@ class AwsVirtualMachine(virtual_machine.BaseVirtualMachine):
 
   def _Create(self):
     """Create a VM instance."""
+    # A failed launch refreshes the client token (here, in _Exists or in
+    # _WaitUntilRunning). Reusing a command with the old token would make EC2
+    # return the failed instance again, so rebuild it to pick up the new token
+    # and any new dedicated host.
+    if '--client-token=%s' % self.client_token not in self.create_cmd:
+      self.create_cmd = self._GenerateCreateCommand()
     _, stderr, retcode = vm_util.IssueCommand(
         self.create_cmd, raise_on_failure=False
     )
@@ -1093,7 +1149,7 @@ class AwsVirtualMachine(virtual_machine.BaseVirtualMachine):
             'Creation failed due to insufficient host capacity. A new host '
             'will be created and instance creation will be retried.'
         )
-        with self._lock:
+        with self._host_lock:
           if self.num_hosts == len(self.host_list):
             host = AwsDedicatedHost(self.machine_type, self.zone)
             self.host_list.append(host)
@@ -1592,6 +1648,28 @@ class BaseLinuxAwsVirtualMachine(
             f'sudo ethtool -L {device_name} combined {queue_count}'
         )
 
+  def PrepareVMEnvironment(self):
+    super().PrepareVMEnvironment()
+    if aws_flags.AWS_INITIALIZE_ROOT_VOLUME.value:
+      self._InitializeRootVolume()
+
+  def _InitializeRootVolume(self):
+    """Reads every block of the root volume so later reads run at full speed."""
+    # https://docs.aws.amazon.com/ebs/latest/userguide/ebs-initialize.html
+    root_partition, _ = self.RemoteCommand(
+        'findmnt --noheadings --output SOURCE /'
+    )
+    root_partition = root_partition.strip()
+    parent, _ = self.RemoteCommand(
+        f'lsblk --nodeps --noheadings --output PKNAME {root_partition}'
+    )
+    root_device = f'/dev/{parent.strip()}' if parent.strip() else root_partition
+    self.InstallPackages('fio')
+    self.RemoteCommand(
+        f'sudo fio --filename={root_device} --rw=read --bs=1M --iodepth=32'
+        ' --ioengine=libaio --direct=1 --name=volume-initialize'
+    )
+
 
 class ClearBasedAwsVirtualMachine(
     BaseLinuxAwsVirtualMachine, linux_virtual_machine.ClearMixin
@@ -1898,7 +1976,7 @@ class BaseWindowsAwsVirtualMachine(
         == 0
     )
 
-  @vm_util.Retry()
+  @vm_util.Retry(timeout=_PASSWORD_DATA_TIMEOUT)
   def _GetDecodedPasswordData(self):
     # Retrieve a base64 encoded, encrypted password for the VM.
     get_password_cmd = util.AWS_PREFIX + [
@@ -1926,22 +2004,18 @@ class BaseWindowsAwsVirtualMachine(
     # Get the decoded password data.
     decoded_password_data = self._GetDecodedPasswordData()
 
-    # Write the encrypted data to a file, and use openssl to
-    # decrypt the password.
-    with vm_util.NamedTemporaryFile() as tf:
-      tf.write(decoded_password_data)
-      tf.close()
-      decrypt_cmd = [
-          'openssl',
-          'rsautl',
-          '-decrypt',
-          '-in',
-          tf.name,
-          '-inkey',
-          vm_util.GetPrivateKeyPath(),
-      ]
-      password, _ = vm_util.IssueRetryableCommand(decrypt_cmd)
-      self.password = password
+    # Pipe the encrypted data to openssl to decrypt the password.
+    decrypt_cmd = [
+        'openssl',
+        'rsautl',
+        '-decrypt',
+        '-inkey',
+        vm_util.GetPrivateKeyPath(),
+    ]
+    password, _ = vm_util.IssueRetryableCommand(
+        decrypt_cmd, stdin_data=decoded_password_data
+    )
+    self.password = password
 
   def GetResourceMetadata(self):
     """Returns a dict containing metadata about the VM.
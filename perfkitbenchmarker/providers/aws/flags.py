@@ -39,6 +39,13 @@ AWS_NIC_QUEUE_COUNTS = flags.DEFINE_list(
     'The queue count of each NIC. Specify a list of key=value pairs, where key'
     ' is the network device name and value is the queue count.',
 )
+AWS_INITIALIZE_ROOT_VOLUME = flags.DEFINE_boolean(
+    'aws_initialize_root_volume',
+    False,
+    'Whether to read every block of the root EBS volume before running the'
+    ' benchmark. Volumes created from snapshots, including AMIs, fetch each'
+    ' block lazily on first access, which makes first reads slow.',
+)
 
 flags.DEFINE_string(
     'aws_dax_node_type',
@@ -16,6 +16,7 @@
 
 
 import collections
+import functools
 import json
 import re
 import string
@@ -259,6 +260,7 @@ def AddDefaultTags(resource_id, region):
   AddTags(resource_id, region, **tags)
 
 
+@functools.lru_cache()
 def _GetCallerId() -> Dict[str, str]:
   cmd = AWS_PREFIX + ['sts', 'get-caller-identity']
   stdout, _, _ = vm_util.IssueCommand(cmd)
@@ -59,6 +59,9 @@ class CreatePDDiskStrategy(GCPCreateDiskStrategy):
   def __init__(self, vm: Any, disk_spec: disk.BaseDiskSpec, disk_count: int):
     super().__init__(vm, disk_spec, disk_count)
     self.remote_disk_groups = []
+    # Disk names as created. The GceDisk names are later overwritten with
+    # device paths for NVMe disks, so keep a copy for resource-level calls.
+    self.remote_disk_names = []
     self.setup_disk_strategy = None
     for disk_spec_id, disk_spec in enumerate(self.disk_specs):
       disks = []
@@ -83,6 +86,7 @@ class CreatePDDiskStrategy(GCPCreateDiskStrategy):
           data_disk.interface = gce_disk.SCSI
         vm.remote_disk_counter += 1
         disks.append(data_disk)
+        self.remote_disk_names.append(name)
       self.remote_disk_groups.append(disks)
 
   def DiskCreatedOnVMCreation(self) -> bool:
@@ -95,20 +99,13 @@ class CreatePDDiskStrategy(GCPCreateDiskStrategy):
   def AddMetadataToDiskResource(self):
     if not self.DiskCreatedOnVMCreation():
       return
-    for disk_spec_id, disk_spec in enumerate(self.disk_specs):
-      for i in range(disk_spec.num_striped_disks):
-        name = _GenerateDiskNamePrefix(
-            self.vm,
-            disk_spec.multi_writer_group_name,
-            disk_spec_id,
-            disk_spec.multi_writer_mode,
-            i,
-        )
-        cmd = util.GcloudCommand(
-            self.vm, 'compute', 'disks', 'add-labels', name
-        )
-        cmd.flags['labels'] = util.MakeFormattedDefaultTags()
-        cmd.Issue()
+    labels = util.MakeFormattedDefaultTags()
+    label_tasks = []
+    for name in self.remote_disk_names:
+      cmd = util.GcloudCommand(self.vm, 'compute', 'disks', 'add-labels', name)
+      cmd.flags['labels'] = labels
+      label_tasks.append((cmd.Issue, (), {}))
+    background_tasks.RunParallelThreads(label_tasks, max_concurrency=200)
 
   def GetCreationCommand(self) -> dict[str, Any]:
     if not self.DiskCreatedOnVMCreation():
@@ -354,13 +351,15 @@ class SetUpPDDiskStrategy(SetUpGCEResourceDiskStrategy):
     background_tasks.RunParallelThreads(create_tasks, max_concurrency=200)
     self.scratch_disks = [scratch_disk for scratch_disk, _ in scratch_disks]
     self.AttachDisks()
-    for scratch_disk, disk_spec in scratch_disks:
-      # Device path is needed to stripe disks on Linux, but not on Windows.
-      # The path is not updated for Windows machines.
-      if self.vm.OS_TYPE not in os_types.WINDOWS_OS_TYPES:
-        nvme_devices = self.vm.GetNVMEDeviceInfo()
-        remote_nvme_devices = self.FindRemoteNVMEDevices(nvme_devices)
+    # Device path is needed to stripe disks on Linux, but not on Windows.
+    # The path is not updated for Windows machines. All disks are attached by
+    # now, so list the devices once and hand them out across every disk spec.
+    if scratch_disks and self.vm.OS_TYPE not in os_types.WINDOWS_OS_TYPES:
+      nvme_devices = self.vm.GetNVMEDeviceInfo()
+      remote_nvme_devices = self.FindRemoteNVMEDevices(nvme_devices)
+      for scratch_disk, _ in scratch_disks:
         self.UpdateDevicePath(scratch_disk, remote_nvme_devices)
+    for scratch_disk, disk_spec in scratch_disks:
       GCEPrepareScratchDiskStrategy().PrepareScratchDisk(
           self.vm, scratch_disk, disk_spec
       )
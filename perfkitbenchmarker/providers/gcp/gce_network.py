@@ -694,6 +694,60 @@ class GceFirewall(network.BaseFirewall):
       self.firewall_rules[key] = firewall_rule
       firewall_rule.Create()
 
+  def AllowPorts(
+      self,
+      vm,  # gce_virtual_machine.GceVirtualMachine
+      ports: List[int],
+      source_range: List[str] | None = None,
+  ):
+    """Opens several individual ports on the firewall with a single rule.
+
+    Args:
+      vm: The BaseVirtualMachine object to open the ports for.
+      ports: List of ports to open.
+      source_range: List of source CIDRs to allow for these ports. If none, all
+        sources are allowed.
+    """
+    ports = sorted(set(ports))
+    if len(ports) < 2:
+      super().AllowPorts(vm, ports, source_range)
+      return
+    if vm.is_static:
+      return
+    if source_range:
+      source_range = ','.join(source_range)
+    # The "ports" infix keeps a two port rule such as 22,3389 from taking the
+    # name AllowPort gives the 22-3389 range.
+    port_string = 'ports-' + '-'.join(str(port) for port in ports)
+    with self._lock:
+      if vm.cidr:  # Allow multiple networks per zone.
+        cidr_string = network.BaseNetwork.FormatCidrString(vm.cidr)
+        firewall_name = 'perfkit-firewall-%s-%s-%s' % (
+            cidr_string,
+            FLAGS.run_uri,
+            port_string,
+        )
+        key = (vm.project, vm.cidr, tuple(ports), source_range)
+      else:
+        firewall_name = 'perfkit-firewall-%s-%s' % (FLAGS.run_uri, port_string)
+        key = (vm.project, tuple(ports), source_range)
+      if key in self.firewall_rules:
+        return
+      allow = ','.join(
+          '{}:{}'.format(protocol, port)
+          for protocol in ('tcp', 'udp')
+          for port in ports
+      )
+      firewall_rule = GceFirewallRule(
+          firewall_name,
+          vm.project,
+          allow,
+          vm.network.network_resource.name,
+          source_range,
+      )
+      self.firewall_rules[key] = firewall_rule
+      firewall_rule.Create()
+
   def DisallowAllPorts(self):
     """Closes all ports on the firewall."""
     for firewall_rule in self.firewall_rules.values():
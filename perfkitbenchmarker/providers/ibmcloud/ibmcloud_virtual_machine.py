@@ -461,22 +461,18 @@ class WindowsIbmCloudVirtualMachine(
     # Get the decoded password data.
     decoded_password_data = self._GetDecodedPasswordData()
 
-    # Write the encrypted data to a file, and use openssl to
-    # decrypt the password.
-    with vm_util.NamedTemporaryFile() as tf:
-      tf.write(decoded_password_data)
-      tf.close()
-      decrypt_cmd = [
-          'openssl',
-          'rsautl',
-          '-decrypt',
-          '-in',
-          tf.name,
-          '-inkey',
-          vm_util.GetPrivateKeyPath(),
-      ]
-      password, _ = vm_util.IssueRetryableCommand(decrypt_cmd)
-      self.password = password
+    # Pipe the encrypted data to openssl to decrypt the password.
+    decrypt_cmd = [
+        'openssl',
+        'rsautl',
+        '-decrypt',
+        '-inkey',
+        vm_util.GetPrivateKeyPath(),
+    ]
+    password, _ = vm_util.IssueRetryableCommand(
+        decrypt_cmd, stdin_data=decoded_password_data
+    )
+    self.password = password
     logging.info('Password decrypted for %s, %s', self.fip_address, self.vmid)
 
 
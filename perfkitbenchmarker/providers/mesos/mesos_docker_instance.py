@@ -215,8 +215,8 @@ class MesosDockerInstance(virtual_machine.BaseVirtualMachine):
 
     API in order to create App.
     """
-    cat_cmd = ['cat', vm_util.GetPublicKeyPath()]
-    key_file, _ = vm_util.IssueRetryableCommand(cat_cmd)
+    with open(vm_util.GetPublicKeyPath()) as f:
+      key_file = f.read()
     cmd = (
         "/bin/mkdir /root/.ssh; echo '%s' >> /root/.ssh/authorized_keys; "
         '/usr/sbin/sshd -D' % key_file
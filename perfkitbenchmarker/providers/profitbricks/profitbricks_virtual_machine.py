@@ -14,6 +14,7 @@
 """Class to represent a ProfitBricks Virtual Machine object."""
 
 import base64
+import functools
 import logging
 import os
 from absl import flags
@@ -34,6 +35,13 @@ FLAGS = flags.FLAGS
 TIMEOUT = 1500  # 25 minutes
 
 
+@functools.lru_cache(maxsize=4)
+def _GetUserToken(user_config_path):
+  """Returns the base64 encoded credentials stored in user_config_path."""
+  with open(user_config_path, 'rb') as f:
+    return base64.b64encode(f.read().rstrip(b'\n')).decode('ascii')
+
+
 class CustomMachineTypeSpec(spec.BaseSpec):
   """Properties of a ProfitBricks custom machine type.
 
@@ -195,10 +203,7 @@ class ProfitBricksVirtualMachine(virtual_machine.BaseVirtualMachine):
 
     # Get user authentication credentials
     user_config_path = os.path.expanduser(FLAGS.profitbricks_config)
-
-    with open(user_config_path) as f:
-      user_creds = f.read().rstrip('\n')
-      self.user_token = base64.b64encode(user_creds)
+    self.user_token = _GetUserToken(user_config_path)
 
     self.server_id = None
     self.server_status = None
@@ -348,7 +353,11 @@ class ProfitBricksVirtualMachine(virtual_machine.BaseVirtualMachine):
     if not self._WaitUntilReady(delete_status):
       raise errors.Error('Data center deletion failed, see log.')
 
-  @vm_util.Retry(timeout=TIMEOUT, log_errors=False)
+  # Most requests finish within seconds, so start polling quickly and back off
+  # for the slow ones.
+  @vm_util.Retry(
+      poll_interval=1, max_poll_interval=60, timeout=TIMEOUT, log_errors=False
+  )
   def _WaitUntilReady(self, status_url):
     """Returns true if the ProfitBricks resource is ready."""
 
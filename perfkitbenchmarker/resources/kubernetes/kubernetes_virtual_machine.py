@@ -13,6 +13,8 @@
 # limitations under the License.
 """Contains code related to lifecycle management of Kubernetes Pods."""
 
+import functools
+import importlib
 import json
 import logging
 import os
@@ -31,9 +33,6 @@ from perfkitbenchmarker import provider_info
 from perfkitbenchmarker import virtual_machine
 from perfkitbenchmarker import vm_util
 from perfkitbenchmarker.linux_packages import google_cloud_sdk
-from perfkitbenchmarker.providers.aws import aws_virtual_machine
-from perfkitbenchmarker.providers.azure import azure_virtual_machine
-from perfkitbenchmarker.providers.gcp import gce_virtual_machine
 from perfkitbenchmarker.resources.kubernetes import flags as k8s_flags
 from perfkitbenchmarker.resources.kubernetes import kubernetes_disk
 from perfkitbenchmarker.resources.kubernetes import kubernetes_pod_spec
@@ -45,6 +44,22 @@ logger = logging.getLogger()
 
 SELECTOR_PREFIX = 'pkb'
 
+# Provider VM modules are only needed for preprovisioned data on the matching
+# cloud, so import them on first use rather than loading every provider.
+_PROVIDER_VM_MODULES = {
+    provider_info.GCP: 'perfkitbenchmarker.providers.gcp.gce_virtual_machine',
+    provider_info.AWS: 'perfkitbenchmarker.providers.aws.aws_virtual_machine',
+    provider_info.AZURE: (
+        'perfkitbenchmarker.providers.azure.azure_virtual_machine'
+    ),
+}
+
+
+@functools.lru_cache()
+def _GetProviderVmModule(cloud: str):
+  """Imports and returns the virtual machine module for the given cloud."""
+  return importlib.import_module(_PROVIDER_VM_MODULES[cloud])
+
 
 def _IsKubectlErrorEphemeral(retcode: int, stderr: str) -> bool:
   """Determine if kubectl error is retriable."""
@@ -652,23 +667,14 @@ class DebianBasedKubernetesVirtualMachine(
       AttributeError: if the VirtualMachine class does not implement
         GenerateDownloadPreprovisionedDataCommand.
     """
-    if self.cloud == 'GCP':
-      download_function = (
-          gce_virtual_machine.GenerateDownloadPreprovisionedDataCommand
-      )
-    elif self.cloud == 'AWS':
-      download_function = (
-          aws_virtual_machine.GenerateDownloadPreprovisionedDataCommand
-      )
-    elif self.cloud == 'Azure':
-      download_function = (
-          azure_virtual_machine.GenerateDownloadPreprovisionedDataCommand
-      )
-    else:
+    if self.cloud not in _PROVIDER_VM_MODULES:
       raise NotImplementedError(
           'Cloud {} does not support downloading preprovisioned '
           'data on Kubernetes VMs.'.format(self.cloud)
       )
+    download_function = _GetProviderVmModule(
+        self.cloud
+    ).GenerateDownloadPreprovisionedDataCommand
 
     self.RemoteCommand(
         download_function(install_path, module_name, filename), timeout=timeout
@@ -684,6 +690,7 @@ class DebianBasedKubernetesVirtualMachine(
   def ShouldDownloadPreprovisionedData(self, module_name: str, filename: str):
     """Returns whether or not preprovisioned data is available."""
     if self.cloud == 'GCP' and FLAGS.gcp_preprovisioned_data_bucket:
+      gce_virtual_machine = _GetProviderVmModule(self.cloud)
       stat_function = gce_virtual_machine.GenerateStatPreprovisionedDataCommand
       gce_virtual_machine.GceVirtualMachine.InstallCli(self)
       # We assume that gsutil is installed to /usr/bin/gsutil on GCE VMs
@@ -693,9 +700,11 @@ class DebianBasedKubernetesVirtualMachine(
           f'{google_cloud_sdk.GCLOUD_PATH} {google_cloud_sdk.GSUTIL_PATH}'
       )
     elif self.cloud == 'AWS' and FLAGS.aws_preprovisioned_data_bucket:
+      aws_virtual_machine = _GetProviderVmModule(self.cloud)
       stat_function = aws_virtual_machine.GenerateStatPreprovisionedDataCommand
       aws_virtual_machine.AwsVirtualMachine.InstallCli(self)
     elif self.cloud == 'Azure' and FLAGS.azure_preprovisioned_data_account:
+      azure_virtual_machine = _GetProviderVmModule(self.cloud)
       stat_function = (
           azure_virtual_machine.GenerateStatPreprovisionedDataCommand
       )
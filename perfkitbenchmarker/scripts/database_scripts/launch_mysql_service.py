@@ -43,7 +43,9 @@ Launcher has a few defaults, listed below:
 
 import datetime
 import logging
+import os
 import re
+import selectors
 import shlex
 import subprocess
 import sys
@@ -72,27 +74,29 @@ STDOUT = 'STDOUT'
 STDERR = 'STDERR'
 DATETIME_FORMAT = '{:%m_%d_%Y_%H_%M_}'
 URI_REGEX = r'run_uri=([a-z0-9]{8})'
+URI_RE = re.compile(URI_REGEX)
 ADDITIONAL_FLAGS = 'additional_flags'
 SLEEP_TIME_BETWEEN_RUNS = 20  # seconds
-TAIL_LINE_NUM = '20'
+TAIL_LINE_NUM = 20
+TAIL_MAX_BYTES = 65536
 
 PKB_TIMEOUT = 43200  # max wait time for a run in seconds
 TIME_MIN = 1
 
 # FLAG STRINGS
-PKB = './pkb.py --benchmarks=mysql_service'
-STAGE_FLAG = ' --run_stage='
-URI_FLAG = ' --run_uri='
-THREAD_FLAG = ' --sysbench_thread_count='
-RUN_TIME = ' --sysbench_run_seconds='
-WARMUP_FLAG = ' --sysbench_warmup_seconds='
-BOOT_DISK_SIZE_FLAG = ' --gce_boot_disk_size='
-BOOT_DISK_TYPE_FLAG = ' --gce_boot_disk_type='
-MACHINE_TYPE_FLAG = ' --machine_type='
-MYSQL_SVC_DB_CORES_FLAG = ' --mysql_svc_db_instance_cores='
-MYSQL_SVC_DB_TABLES_COUNT_FLAG = ' --mysql_svc_oltp_tables_count='
-MYSQL_SVC_OLTP_TABLE_SIZE_FLAG = ' --mysql_svc_oltp_table_size='
-MYSQL_INSTANCE_STORAGE_SIZE_FLAG = ' --mysql_instance_storage_size='
+PKB = ['./pkb.py', '--benchmarks=mysql_service']
+STAGE_FLAG = '--run_stage='
+URI_FLAG = '--run_uri='
+THREAD_FLAG = '--sysbench_thread_count='
+RUN_TIME = '--sysbench_run_seconds='
+WARMUP_FLAG = '--sysbench_warmup_seconds='
+BOOT_DISK_SIZE_FLAG = '--gce_boot_disk_size='
+BOOT_DISK_TYPE_FLAG = '--gce_boot_disk_type='
+MACHINE_TYPE_FLAG = '--machine_type='
+MYSQL_SVC_DB_CORES_FLAG = '--mysql_svc_db_instance_cores='
+MYSQL_SVC_DB_TABLES_COUNT_FLAG = '--mysql_svc_oltp_tables_count='
+MYSQL_SVC_OLTP_TABLE_SIZE_FLAG = '--mysql_svc_oltp_table_size='
+MYSQL_INSTANCE_STORAGE_SIZE_FLAG = '--mysql_instance_storage_size='
 
 PROVISION = 'provision'
 PREPARE = 'prepare'
@@ -232,28 +236,22 @@ def _provision_prepare_pkb():
   Returns:
     run_uri: (string)
   """
-  pkb_cmd = PKB + STAGE_FLAG + PROVISION + ',' + PREPARE
-  pkb_cmd += (
-      BOOT_DISK_SIZE_FLAG
-      + FLAGS.gce_boot_disk_size
-      + BOOT_DISK_TYPE_FLAG
-      + FLAGS.gce_boot_disk_type
-      + MACHINE_TYPE_FLAG
-      + FLAGS.machine_type
-      + MYSQL_SVC_DB_CORES_FLAG
-      + FLAGS.mysql_svc_db_instance_cores
-      + MYSQL_SVC_OLTP_TABLE_SIZE_FLAG
-      + FLAGS.mysql_svc_oltp_table_size
-      + MYSQL_SVC_DB_TABLES_COUNT_FLAG
-      + FLAGS.mysql_svc_oltp_tables_count
-      + MYSQL_INSTANCE_STORAGE_SIZE_FLAG
-      + FLAGS.mysql_instance_storage_size
-  )
+  pkb_cmd = PKB + [
+      STAGE_FLAG + PROVISION + ',' + PREPARE,
+      BOOT_DISK_SIZE_FLAG + FLAGS.gce_boot_disk_size,
+      BOOT_DISK_TYPE_FLAG + FLAGS.gce_boot_disk_type,
+      MACHINE_TYPE_FLAG + FLAGS.machine_type,
+      MYSQL_SVC_DB_CORES_FLAG + FLAGS.mysql_svc_db_instance_cores,
+      MYSQL_SVC_OLTP_TABLE_SIZE_FLAG + FLAGS.mysql_svc_oltp_table_size,
+      MYSQL_SVC_DB_TABLES_COUNT_FLAG + FLAGS.mysql_svc_oltp_tables_count,
+      MYSQL_INSTANCE_STORAGE_SIZE_FLAG + FLAGS.mysql_instance_storage_size,
+  ]
   if FLAGS.additional_flags:
-    pkb_cmd = _append_additional_flags(pkb_cmd)
+    _append_additional_flags(pkb_cmd)
   # PKB run with prepare,provision, wait
   logging.info(
-      'Provision and prepare sysbench with the following command:\n%s', pkb_cmd
+      'Provision and prepare sysbench with the following command:\n%s',
+      ' '.join(pkb_cmd),
   )
   [stdout_filename, stderr_filename] = _generate_filenames(PROVISION, None)
   _execute_pkb_cmd(pkb_cmd, stdout_filename, stderr_filename)
@@ -276,30 +274,29 @@ def _run(run_uri):
       'Beginning run phase. Will execute runs with %d different thread counts.',
       run_iterations,
   )
+  # Flags that are the same for every thread count.
+  run_flags = [
+      RUN_TIME + str(FLAGS.sysbench_run_seconds),
+      WARMUP_FLAG + str(FLAGS.sysbench_warmup_seconds),
+  ]
+  if FLAGS.additional_flags:
+    _append_additional_flags(run_flags)
   for t in FLAGS.thread_count_list:
-    pkb_cmd = (
-        PKB
-        + STAGE_FLAG
-        + RUN
-        + URI_FLAG
-        + run_uri
-        + THREAD_FLAG
-        + str(t)
-        + RUN_TIME
-        + str(FLAGS.sysbench_run_seconds)
-        + WARMUP_FLAG
-        + str(FLAGS.sysbench_warmup_seconds)
-    )
-    if FLAGS.additional_flags:
-      pkb_cmd = _append_additional_flags(pkb_cmd)
+    pkb_cmd = PKB + [STAGE_FLAG + RUN, URI_FLAG + run_uri, THREAD_FLAG + str(t)]
+    pkb_cmd += run_flags
     stdout_filename, stderr_filename = _generate_filenames(RUN, t)
     logging.info('Executing PKB run with thread count: %s', t)
-    logging.info('Run sysbench with the following command:\n%s', pkb_cmd)
+    logging.info(
+        'Run sysbench with the following command:\n%s', ' '.join(pkb_cmd)
+    )
     try:
       _execute_pkb_cmd(pkb_cmd, stdout_filename, stderr_filename)
     except CallFailureError:
       logging.info('Call Failed. Ending run phase.')
       break
+    except OperationTimeoutError:
+      logging.info('Call timed out. Ending run phase.')
+      break
     if FLAGS.per_second_graphs:
       logging.info('Adding Sysbench STDERR to per second graph.')
       plotter.add_file(stderr_filename)
@@ -317,9 +314,10 @@ def _cleanup_teardown_pkb(run_uri):
     run_uri: (string)
   """
   logging.info('Run phase complete. Starting cleanup/teardown.')
-  pkb_cmd = PKB + STAGE_FLAG + CLEANUP + ',' + TEARDOWN + URI_FLAG + run_uri
+  pkb_cmd = PKB + [STAGE_FLAG + CLEANUP + ',' + TEARDOWN, URI_FLAG + run_uri]
   logging.info(
-      'Cleanup, teardown sysbench with the following command:\n%s', pkb_cmd
+      'Cleanup, teardown sysbench with the following command:\n%s',
+      ' '.join(pkb_cmd),
   )
   [stdout_filename, stderr_filename] = _generate_filenames(CLEANUP, None)
   _execute_pkb_cmd(pkb_cmd, stdout_filename, stderr_filename)
@@ -330,23 +328,27 @@ def _execute_pkb_cmd(pkb_cmd, stdout_filename, stderr_filename):
   """Given pkb run command, execute.
 
   Args:
-    pkb_cmd: (str)
+    pkb_cmd: (list) PKB command as a list of arguments.
     stdout_filename: (str) filename string.
     stderr_filename: (str) filename_str
 
   Raises:
     CallFailureError: Popen call failed.
+    OperationTimeoutError: PKB call did not finish within PKB_TIMEOUT seconds.
   """
-  stdout_file = open(stdout_filename, 'w+')
-  stderr_file = open(stderr_filename, 'w+')
-  pkb_cmd_list = shlex.split(pkb_cmd)
-  logging.info('pkb command list: %s', str(pkb_cmd_list))
+  logging.info('pkb command list: %s', str(pkb_cmd))
   start_time = time.time()
-  p = subprocess.Popen(pkb_cmd_list, stdout=stdout_file, stderr=stderr_file)
-  logging.info('Waiting for PKB call to finish.')
-  # TODO: implement timeout. Currently this call will wait unbounded.
-  # Will probably have to implement with threading.
-  p.wait()
+  with open(stdout_filename, 'w+') as stdout_file, open(
+      stderr_filename, 'w+'
+  ) as stderr_file:
+    p = subprocess.Popen(pkb_cmd, stdout=stdout_file, stderr=stderr_file)
+    logging.info('Waiting for PKB call to finish.')
+    if not _wait_for_exit(p, PKB_TIMEOUT):
+      p.kill()
+      p.wait()
+      raise OperationTimeoutError(
+          'The call did not finish within {} seconds.'.format(PKB_TIMEOUT)
+      )
   elapsed_time = time.time() - start_time
   retcode = p.returncode
   if retcode != 0:
@@ -357,6 +359,39 @@ def _execute_pkb_cmd(pkb_cmd, stdout_filename, stderr_filename):
   logging.info('PKB call finished in %i seconds.', int(elapsed_time))
 
 
+def _wait_for_exit(p, timeout):
+  """Waits for a child process to exit.
+
+  Where os.pidfd_open is available (Linux 5.3+), the wait sleeps on the
+  process's pidfd until the kernel reports the exit. Elsewhere it falls back to
+  Popen.wait, which polls.
+
+  Args:
+    p: (subprocess.Popen) the child process.
+    timeout: (int) seconds to wait before giving up.
+
+  Returns:
+    True if the process exited within timeout, False otherwise.
+  """
+  try:
+    pidfd = os.pidfd_open(p.pid)
+  except (AttributeError, OSError):
+    try:
+      p.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+      return False
+    return True
+  try:
+    with selectors.DefaultSelector() as selector:
+      selector.register(pidfd, selectors.EVENT_READ)
+      if not selector.select(timeout):
+        return False
+  finally:
+    os.close(pidfd)
+  p.wait()
+  return True
+
+
 def _get_run_uri(filename):
   """Grab the last lines of file and return the first match with URI_REGEX.
 
@@ -368,17 +403,13 @@ def _get_run_uri(filename):
   Raises:
     Exception: No match with regular expression. Unexpected output to filename.
   """
-  grab_file_tail_cmd = ['tail', '-n', TAIL_LINE_NUM, filename]
-  p = subprocess.Popen(
-      grab_file_tail_cmd,
-      stdout=subprocess.PIPE,
-      stderr=subprocess.PIPE,
-      universal_newlines=True,
-  )
-  lines = p.stdout.readlines()
-  r = re.compile(URI_REGEX)
+  with open(filename, 'rb') as f:
+    f.seek(0, os.SEEK_END)
+    f.seek(max(0, f.tell() - TAIL_MAX_BYTES))
+    tail = f.read().decode(errors='replace')
+  lines = tail.splitlines()[-TAIL_LINE_NUM:]
   for line in lines:
-    matches = r.search(line)
+    matches = URI_RE.search(line)
     if matches:
       return matches.group(matches.lastindex)
   raise UnexpectedFileOutputError('No regex match with {}.'.format(filename))
@@ -387,15 +418,14 @@ def _get_run_uri(filename):
 def _append_additional_flags(pkb_cmd):
   """Appends additional flags to the end of pkb_cmd.
 
-  Args:
-    pkb_cmd: (string) Current pkb command.
+  Each additional flag is split with shell quoting rules, so quoted values
+  passed through launch_driver.sh keep working.
 
-  Returns:
-    pkb_cmd: (string) PKB command with additional flags.
+  Args:
+    pkb_cmd: (list) Current pkb command, extended in place.
   """
   for flag in FLAGS.additional_flags:
-    pkb_cmd += ' ' + flag
-  return pkb_cmd
+    pkb_cmd.extend(shlex.split(flag))
 
 
 def _generate_filenames(run_stage, thread_number):
@@ -410,15 +440,11 @@ def _generate_filenames(run_stage, thread_number):
   """
   date_string = DATETIME_FORMAT.format(datetime.datetime.now())
   if run_stage == RUN:
-    stdout_filename = '{}{}_THREAD_RUN_PKB_STDOUT.txt'.format(
-        date_string, thread_number
-    )
-    stderr_filename = '{}{}_THREAD_RUN_PKB_STDERR.txt'.format(
-        date_string, thread_number
-    )
+    prefix = '{}{}_THREAD_RUN_PKB'.format(date_string, thread_number)
   else:
-    stdout_filename = '{}{}_PKB_STDOUT.txt'.format(date_string, run_stage)
-    stderr_filename = '{}{}_PKB_STDERR.txt'.format(date_string, run_stage)
+    prefix = '{}{}_PKB'.format(date_string, run_stage)
+  stdout_filename = prefix + '_STDOUT.txt'
+  stderr_filename = prefix + '_STDERR.txt'
   logging.info('STDOUT will be copied to: %s', stdout_filename)
   logging.info('STDERR will be copied to: %s', stderr_filename)
   return [stdout_filename, stderr_filename]
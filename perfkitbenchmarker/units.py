@@ -17,8 +17,10 @@ Forwards access to pint Quantity and Unit classes built around a customized
 unit registry.
 """
 
+import copyreg
+import functools
+
 import pint
-import six.moves.copyreg
 
 
 class _UnitRegistry(pint.UnitRegistry):
@@ -57,11 +59,29 @@ def _PickleQuantity(q):
   return _UnPickleQuantity, (q.to_tuple(),)
 
 
+@functools.lru_cache(maxsize=None)
+def _GetUnitsContainer(units):
+  """Returns the (immutable) UnitsContainer for a tuple of unit items."""
+  return pint.util.UnitsContainer(units)
+
+
 def _UnPickleQuantity(inp):
-  return _UNIT_REGISTRY.Quantity.from_tuple(inp)
+  # Equivalent to Quantity.from_tuple, but samples share a handful of units so
+  # reuse their UnitsContainers rather than rebuilding one per Quantity.
+  magnitude, units = inp
+  return _UNIT_REGISTRY.Quantity(magnitude, _GetUnitsContainer(units))
+
+
+copyreg.pickle(_UNIT_REGISTRY.Quantity, _PickleQuantity)
+
+
+def _DeepCopyUnit(unit, memo):
+  """Units are immutable, so a deep copy can share the original."""
+  del memo
+  return unit
 
 
-six.moves.copyreg.pickle(_UNIT_REGISTRY.Quantity, _PickleQuantity)
+_UNIT_REGISTRY.Unit.__deepcopy__ = _DeepCopyUnit
 
 
 # Forward access to pint's classes and functions.
@@ -813,8 +813,8 @@ class BaseVirtualMachine(os_mixin.BaseOsMixin, resource.BaseResource):
 
   def AllowRemoteAccessPorts(self):
     """Allow all ports in self.remote_access_ports."""
-    for port in self.remote_access_ports:
-      self.AllowPort(port)
+    if self.firewall and not FLAGS.skip_firewall_rules:
+      self.firewall.AllowPorts(self, self.remote_access_ports)
 
   def AddMetadata(self, **kwargs):
     """Add key/value metadata to the instance.
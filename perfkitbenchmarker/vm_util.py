@@ -322,6 +322,7 @@ def Retry(
     fuzz=FUZZ,
     log_errors=True,
     retryable_exceptions=None,
+    max_poll_interval=None,
 ):
   """A function decorator that will retry when exceptions are thrown.
 
@@ -342,6 +343,8 @@ def Retry(
     retryable_exceptions: A tuple of exceptions that should be retried. By
       default, this is None, which indicates that all exceptions should be
       retried.
+    max_poll_interval: If set, the poll interval starts at poll_interval and
+      doubles after each try, up to max_poll_interval.
 
   Returns:
     A function that wraps functions in retry logic. It can be
@@ -370,13 +373,14 @@ def Retry(
         deadline = float('inf')
 
       tries = 0
+      current_poll_interval = poll_interval
       while True:
         try:
           tries += 1
           return f(*args, **kwargs)
         except retryable_exceptions as e:
           fuzz_multiplier = 1 - fuzz + random.random() * fuzz
-          sleep_time = poll_interval * fuzz_multiplier
+          sleep_time = current_poll_interval * fuzz_multiplier
           if (time.time() + sleep_time) >= deadline:
             raise TimeoutExceededRetryError() from e
           elif max_retries >= 0 and tries > max_retries:
@@ -385,6 +389,10 @@ def Retry(
             if log_errors:
               logging.info('Retrying exception running %s: %s', f.__name__, e)
             time.sleep(sleep_time)
+            if max_poll_interval is not None:
+              current_poll_interval = min(
+                  current_poll_interval * 2, max_poll_interval
+              )
 
     return WrappedFunction
 
@@ -422,6 +430,7 @@ def IssueCommand(
     suppress_logging: bool = False,
     raise_on_timeout: bool = True,
     stack_level: int = 1,
+    stdin_data: bytes | None = None,
 ) -> Tuple[str, str, int]:
   """Tries running the provided command once.
 
@@ -450,6 +459,7 @@ def IssueCommand(
       timeout being hit should raise a IssueCommandTimeoutError
     stack_level: Number of stack frames to skip & get an "interesting" caller,
       for logging. 1 skips this function, 2 skips this & its caller, etc..
+    stdin_data: Bytes written to the command's stdin, which is then closed.
 
   Returns:
     A tuple of stdout, stderr, and retcode from running the provided command.
@@ -548,6 +558,9 @@ def IssueCommand(
     timer.start()
 
     try:
+      if stdin_data is not None:
+        process.stdin.write(stdin_data)
+        process.stdin.close()
       process.wait()
     finally:
       timer.cancel()
@@ -903,5 +916,5 @@ def CreateRemoteFile(vm, file_contents, file_path):
 def ReadLocalFile(filename: str) -> str:
   """Read the local file."""
   file_path = posixpath.join(GetTempDir(), filename)
-  stdout, _, _ = IssueCommand(['cat', file_path])
-  return stdout
+  with open(file_path) as f:
+    return f.read()
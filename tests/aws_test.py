@@ -342,6 +342,13 @@ class AwsVirtualMachineTestCase(pkb_common_test_case.PkbCommonTestCase):
     p2 = mock.patch('perfkitbenchmarker.vm_util.IssueCommand')
     p2.start()
     self.addCleanup(p2.stop)
+    self.enter_context(
+        mock.patch.object(
+            vm_util,
+            'GetPublicKeyPath',
+            return_value=self.create_tempfile(content='key_content').full_path,
+        )
+    )
 
     # VM Creation depends on there being a BenchmarkSpec.
     config_spec = benchmark_config_spec.BenchmarkConfigSpec(
@@ -374,6 +381,22 @@ class AwsVirtualMachineTestCase(pkb_common_test_case.PkbCommonTestCase):
     util.IssueRetryableCommand.side_effect = [(self.response, None)]
     self.assertTrue(self.vm._Exists())
 
+  def testDefaultImageQueriedOnce(self):
+    self.enter_context(
+        mock.patch.dict(aws_virtual_machine._describe_images_output)
+    )
+    images = [
+        {'Name': 'ubuntu-old', 'ImageId': 'ami-old', 'CreationDate': '2023'},
+        {'Name': 'ubuntu-new', 'ImageId': 'ami-new', 'CreationDate': '2024'},
+    ]
+    util.IssueRetryableCommand.side_effect = [(json.dumps(images), None)]
+    vm_class = aws_virtual_machine.Ubuntu2404BasedAwsVirtualMachine
+    for _ in range(2):
+      self.assertEqual(
+          vm_class.GetDefaultImage('m5.large', 'us-east-1'), 'ami-new'
+      )
+    util.IssueRetryableCommand.assert_called_once()
+
   @parameterized.named_parameters(
       {
           'testcase_name': 'vpcu_quota_exceeded',
@@ -506,6 +529,15 @@ class AwsVirtualMachineTestCase(pkb_common_test_case.PkbCommonTestCase):
     # Token should be refreshed
     self.assertNotEqual(initial_client_token, self.vm.client_token)
 
+  def testCreateAfterTokenRefreshUsesNewToken(self):
+    vm_util.IssueCommand.side_effect = [('', '', 0)]
+    self.vm._CreateDependencies()
+    self.vm.client_token = 'refreshed-token'
+    vm_util.IssueCommand.side_effect = [(None, '', None)]
+    self.vm._Create()
+    create_cmd = vm_util.IssueCommand.call_args[0][0]
+    self.assertIn('--client-token=refreshed-token', create_cmd)
+
   def testInstanceDeleted(self):
     response = json.loads(self.response)
     state = response['Reservations'][0]['Instances'][0]['State']
@@ -675,6 +707,18 @@ class AwsVirtualMachineTestCase(pkb_common_test_case.PkbCommonTestCase):
     vm._PostCreate()
     vm._InstallEfa.assert_not_called()
 
+  def testInitializeRootVolumeReadsWholeDevice(self):
+    vm = InitVm()
+    vm.RemoteCommand = mock.Mock(
+        side_effect=[('/dev/nvme0n1p1\n', ''), ('nvme0n1\n', ''), ('', '')]
+    )
+    vm.InstallPackages = mock.Mock()
+    vm._InitializeRootVolume()
+    vm.InstallPackages.assert_called_once_with('fio')
+    self.assertIn(
+        '--filename=/dev/nvme0n1 ', vm.RemoteCommand.call_args_list[-1][0][0]
+    )
+
   def testInstallEfa(self):
     # Confirms vm._PostCreate() calls for EFA creation
     FLAGS.aws_efa = True
@@ -764,6 +808,9 @@ class AwsGetBlockDeviceMapTestCase(pkb_common_test_case.PkbCommonTestCase):
     p = mock.patch(util.__name__ + '.IssueRetryableCommand')
     p.start()
     self.addCleanup(p.stop)
+    self.enter_context(
+        mock.patch.dict(aws_virtual_machine._describe_images_output)
+    )
     config_spec = benchmark_config_spec.BenchmarkConfigSpec(
         _BENCHMARK_NAME, flag_values=FLAGS, vm_groups={}
     )
@@ -829,6 +876,9 @@ class AwsGetRootBlockDeviceSpecForImageTestCase(
     p = mock.patch(util.__name__ + '.IssueRetryableCommand')
     p.start()
     self.addCleanup(p.stop)
+    self.enter_context(
+        mock.patch.dict(aws_virtual_machine._describe_images_output)
+    )
 
     path = os.path.join(
         os.path.dirname(__file__), 'data', 'describe_image_output.txt'
@@ -858,13 +908,36 @@ class AwsGetRootBlockDeviceSpecForImageTestCase(
     )
     self.assertEqual(actual, expected)
 
+  def testRootBlockDeviceSpecQueriedOnce(self):
+    images = [{
+        'RootDeviceName': '/dev/sda1',
+        'BlockDeviceMappings': [
+            {'DeviceName': '/dev/sda1', 'Ebs': {'VolumeSize': 8}}
+        ],
+    }]
+    util.IssueRetryableCommand.side_effect = [(json.dumps(images), None)]
+    first = aws_virtual_machine.GetRootBlockDeviceSpecForImage(
+        'ami-12345', 'us-east-1'
+    )
+    first['Ebs']['VolumeSize'] = 35
+    second = aws_virtual_machine.GetRootBlockDeviceSpecForImage(
+        'ami-12345', 'us-east-1'
+    )
+    self.assertEqual(second['Ebs']['VolumeSize'], 8)
+    util.IssueRetryableCommand.assert_called_once()
+
 
 class AwsKeyFileManagerTestCase(pkb_common_test_case.PkbCommonTestCase):
 
-  @mock.patch.object(vm_util, 'IssueRetryableCommand')
   @mock.patch.object(vm_util, 'IssueCommand')
-  def testKeyPairLimitExceeded(self, import_cmd, cat_cmd):
-    cat_cmd.side_effect = [('key_content', None)]
+  def testKeyPairLimitExceeded(self, import_cmd):
+    self.enter_context(
+        mock.patch.object(
+            vm_util,
+            'GetPublicKeyPath',
+            return_value=self.create_tempfile(content='key_content').full_path,
+        )
+    )
     import_cmd.side_effect = [(
         '',
         (
@@ -876,6 +949,15 @@ class AwsKeyFileManagerTestCase(pkb_common_test_case.PkbCommonTestCase):
     with self.assertRaises(errors.Benchmarks.QuotaFailure):
       aws_virtual_machine.AwsKeyFileManager.ImportKeyfile('region')
 
+  def testRegionLocksAreIndependent(self):
+    manager = aws_virtual_machine.AwsKeyFileManager
+    self.assertIs(
+        manager._GetRegionLock('us-east-1'), manager._GetRegionLock('us-east-1')
+    )
+    self.assertIsNot(
+        manager._GetRegionLock('us-east-1'), manager._GetRegionLock('us-west-2')
+    )
+
 
 if __name__ == '__main__':
   unittest.main()
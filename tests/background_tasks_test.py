@@ -138,6 +138,17 @@ class RunParallelThreadsTestCase(pkb_common_test_case.PkbCommonTestCase):
       background_tasks.RunParallelThreads(calls, max_concurrency=2)
     self.assertEqual(int_list, [1])
 
+  def testThreadsAreReused(self):
+    calls = [(threading.get_ident, (), {})] * 2
+    first = background_tasks.RunParallelThreads(calls, max_concurrency=2)
+    second = background_tasks.RunParallelThreads(calls, max_concurrency=2)
+    self.assertTrue(set(first) & set(second))
+
+  def testNestedCallsRun(self):
+    calls = [(background_tasks.RunThreaded, (_ReturnArgs, ['a', 'b']), {})] * 3
+    result = background_tasks.RunParallelThreads(calls, max_concurrency=3)
+    self.assertEqual(result, [[(None, 'a'), (None, 'b')]] * 3)
+
 
 class RunThreadedTestCase(pkb_common_test_case.PkbCommonTestCase):
 
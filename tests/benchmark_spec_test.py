@@ -326,5 +326,62 @@ class RedirectGlobalFlagsTestCase(pkb_common_test_case.PkbCommonTestCase):
     self.assertEqual(FLAGS.benchmark_spec_test_flag, 0)
 
 
+class DeleteTestCase(_BenchmarkSpecTestCase):
+
+  def testNetworkAndFirewallErrorsDoNotStopTeardown(self):
+    config_spec = benchmark_config_spec.BenchmarkConfigSpec(
+        NAME, flag_values=FLAGS, vm_groups={}
+    )
+    spec = benchmark_spec.BenchmarkSpec(mock.MagicMock(), config_spec, UID)
+    failing_net = mock.Mock()
+    failing_net.Delete.side_effect = Exception('network busy')
+    other_net = mock.Mock()
+    firewall = mock.Mock()
+    firewall.DisallowAllPorts.side_effect = Exception('firewall busy')
+    spec.networks = {'zone-a': failing_net, 'zone-b': other_net}
+    spec.firewalls = {'GCP': firewall}
+
+    spec.Delete()
+
+    failing_net.Delete.assert_called_once()
+    other_net.Delete.assert_called_once()
+    firewall.DisallowAllPorts.assert_called_once()
+    self.assertTrue(spec.deleted)
+
+  def testNetworksAreDeletedSerially(self):
+    config_spec = benchmark_config_spec.BenchmarkConfigSpec(
+        NAME, flag_values=FLAGS, vm_groups={}
+    )
+    spec = benchmark_spec.BenchmarkSpec(mock.MagicMock(), config_spec, UID)
+    spec.networks = {'zone-a': mock.Mock(), 'zone-b': mock.Mock()}
+    with mock.patch.object(
+        benchmark_spec.background_tasks, 'RunThreaded'
+    ) as run_threaded:
+      spec.Delete()
+    networks = list(spec.networks.values())
+    for call in run_threaded.call_args_list:
+      self.assertNotEqual(list(call.args[1]), networks)
+    for net in networks:
+      net.Delete.assert_called_once()
+
+  @flagsaver.flagsaver(vm_concurrency=2)
+  def testVmDeletionIsBounded(self):
+    config_spec = benchmark_config_spec.BenchmarkConfigSpec(
+        NAME, flag_values=FLAGS, vm_groups={}
+    )
+    spec = benchmark_spec.BenchmarkSpec(mock.MagicMock(), config_spec, UID)
+    spec.vms = [mock.Mock() for _ in range(5)]
+    with mock.patch.object(
+        benchmark_spec.background_tasks, 'RunThreaded'
+    ) as run_threaded:
+      spec.Delete()
+    vm_calls = [
+        call for call in run_threaded.call_args_list if call.args[1] == spec.vms
+    ]
+    self.assertLen(vm_calls, 2)
+    for call in vm_calls:
+      self.assertEqual(call.kwargs['max_concurrent_threads'], 2)
+
+
 if __name__ == '__main__':
   unittest.main()
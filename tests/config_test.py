@@ -88,6 +88,21 @@ class ConfigsTestCase(unittest.TestCase):
     with self.assertRaises(errors.Config.ParseError):
       configs.LoadMinimalConfig(INVALID_YAML_CONFIG, CONFIG_NAME)
 
+  def testLoadMinimalConfigReturnsIndependentCopies(self):
+    first = configs.LoadMinimalConfig(VALID_CONFIG, CONFIG_NAME)
+    first['vm_groups']['default']['vm_spec'] = 'modified'
+    second = configs.LoadMinimalConfig(VALID_CONFIG, CONFIG_NAME)
+    self.assertIsNone(second['vm_groups']['default']['vm_spec'])
+
+  def testLoadMinimalConfigParsesOnce(self):
+    config = VALID_CONFIG + '\n'
+    with mock.patch.object(
+        yaml, 'safe_load', wraps=yaml.safe_load
+    ) as mock_load:
+      configs.LoadMinimalConfig(config, CONFIG_NAME)
+      configs.LoadMinimalConfig(config, CONFIG_NAME)
+    mock_load.assert_called_once()
+
   def testMergeBasicConfigs(self):
     old_config = yaml.safe_load(CONFIG_A)
     new_config = yaml.safe_load(CONFIG_B)
@@ -132,6 +147,26 @@ class ConfigsTestCase(unittest.TestCase):
     self.assertEqual(config['a']['vm_groups']['default']['vm_count'], 5)
     self.assertEqual(config['a']['flags']['flag'], 'value')
 
+  def testConfigOverrideValueWithEquals(self):
+    p = mock.patch(configs.__name__ + '.FLAGS')
+    self.addCleanup(p.stop)
+    mock_flags = p.start()
+    mock_flags.configure_mock(
+        config_override=['a.flags.flag=key=value'], benchmark_config_file=None
+    )
+    config = configs.GetDefaultAndUserConfig()
+    self.assertEqual(config['a']['flags']['flag'], 'key=value')
+
+  def testConfigOverrideWithoutEqualsRaises(self):
+    p = mock.patch(configs.__name__ + '.FLAGS')
+    self.addCleanup(p.stop)
+    mock_flags = p.start()
+    mock_flags.configure_mock(
+        config_override=['a.flags.flag'], benchmark_config_file=None
+    )
+    with self.assertRaises(ValueError):
+      configs.GetDefaultAndUserConfig()
+
   def testConfigImport(self):
     p = mock.patch(configs.__name__ + '.FLAGS')
     self.addCleanup(p.stop)
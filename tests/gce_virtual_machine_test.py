@@ -1153,6 +1153,49 @@ class GceFirewallRuleTest(pkb_common_test_case.PkbCommonTestCase):
       self.assertEqual(issue_command.call_count, 1)
 
 
+class GceFirewallTest(pkb_common_test_case.PkbCommonTestCase):
+
+  def setUp(self):
+    super().setUp()
+    FLAGS.run_uri = 'abc123'
+    self.mock_create = self.enter_context(
+        mock.patch.object(gce_network.GceFirewallRule, 'Create')
+    )
+    self.vm = mock.Mock(is_static=False, project='project', cidr=None)
+    self.vm.network.network_resource.name = 'network'
+
+  def testAllowPortsCreatesOneRule(self):
+    firewall = gce_network.GceFirewall()
+    firewall.AllowPorts(self.vm, [5986, 445, 3389])
+    firewall.AllowPorts(self.vm, [445, 3389, 5986])
+    self.mock_create.assert_called_once()
+    (rule,) = firewall.firewall_rules.values()
+    self.assertEqual(rule.name, 'perfkit-firewall-abc123-ports-445-3389-5986')
+    self.assertEqual(
+        rule.allow, 'tcp:445,tcp:3389,tcp:5986,udp:445,udp:3389,udp:5986'
+    )
+
+  def testAllowPortsWithSinglePortMatchesAllowPort(self):
+    firewall = gce_network.GceFirewall()
+    firewall.AllowPorts(self.vm, [22])
+    firewall.AllowPort(self.vm, 22)
+    self.mock_create.assert_called_once()
+    (rule,) = firewall.firewall_rules.values()
+    self.assertEqual(rule.name, 'perfkit-firewall-abc123-22-22')
+
+  def testAllowPortsNameDiffersFromPortRange(self):
+    firewall = gce_network.GceFirewall()
+    firewall.AllowPorts(self.vm, [22, 3389])
+    firewall.AllowPort(self.vm, 22, 3389)
+    self.assertCountEqual(
+        [rule.name for rule in firewall.firewall_rules.values()],
+        [
+            'perfkit-firewall-abc123-ports-22-3389',
+            'perfkit-firewall-abc123-22-3389',
+        ],
+    )
+
+
 class GceNetworkTest(pkb_common_test_case.PkbCommonTestCase):
 
   def setUp(self):
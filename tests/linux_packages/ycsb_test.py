@@ -424,6 +424,36 @@ def _GetMockThroughputLatencySamples(
   ]
 
 
+class InstallTestCase(pkb_common_test_case.PkbCommonTestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.enter_context(mock.patch.dict(ycsb._runner_tar_paths, clear=True))
+    self.enter_context(
+        mock.patch.object(ycsb.vm_util, 'GetTempDir', return_value='/tmp/run')
+    )
+    self.issue_command = self.enter_context(
+        mock.patch.object(ycsb.vm_util, 'IssueCommand')
+    )
+
+  def testDownloadsOnEachVmByDefault(self):
+    vm = mock.Mock()
+    ycsb.Install(vm)
+    self.issue_command.assert_not_called()
+    vm.PushFile.assert_not_called()
+
+  @flagsaver.flagsaver(ycsb_push_tar_from_runner=True)
+  def testPushTarFromRunnerDownloadsOnce(self):
+    vms = [mock.Mock(), mock.Mock()]
+    for vm in vms:
+      ycsb.Install(vm)
+    self.issue_command.assert_called_once()
+    for vm in vms:
+      vm.PushFile.assert_called_once_with(
+          '/tmp/run/ycsb-0.tar.gz', '/tmp/pkb/ycsb.tar.gz'
+      )
+
+
 if __name__ == '__main__':
   logging.basicConfig(level=logging.INFO)
   unittest.main()
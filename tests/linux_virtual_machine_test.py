@@ -197,6 +197,56 @@ class LogDmesgTestCase(pkb_common_test_case.PkbCommonTestCase):
     remote_command.assert_called_once_with('hostname && sudo dmesg')
 
 
+class BatchInstallPackagesTestCase(pkb_common_test_case.PkbCommonTestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.vm = CreateTestLinuxVm()
+    self.enter_context(mock.patch.object(self.vm, 'InstallPackages'))
+
+  def testQueueInstallsImmediatelyOutsideBatch(self):
+    self.vm.QueueInstallPackages('numactl')
+    self.vm.InstallPackages.assert_called_once_with('numactl')
+
+  def testBatchInstallsOnceOnExit(self):
+    with self.vm.BatchInstallPackages():
+      self.vm.QueueInstallPackages('lua5.1 liblua5.1-dev')
+      self.vm.QueueInstallPackages('openssl libssl-dev')
+      self.vm.QueueInstallPackages('openssl')
+      self.vm.InstallPackages.assert_not_called()
+    self.vm.InstallPackages.assert_called_once_with(
+        'lua5.1 liblua5.1-dev openssl libssl-dev'
+    )
+
+  def testNestedBatchFlushesInOuterBlock(self):
+    with self.vm.BatchInstallPackages():
+      with self.vm.BatchInstallPackages():
+        self.vm.QueueInstallPackages('numactl')
+      self.vm.InstallPackages.assert_not_called()
+    self.vm.InstallPackages.assert_called_once_with('numactl')
+
+  def testBatchDropsQueueOnError(self):
+    with self.assertRaises(ValueError):
+      with self.vm.BatchInstallPackages():
+        self.vm.QueueInstallPackages('numactl')
+        raise ValueError()
+    self.vm.InstallPackages.assert_not_called()
+    self.vm.QueueInstallPackages('openssl')
+    self.vm.InstallPackages.assert_called_once_with('openssl')
+
+  def testFailedFlushDoesNotMarkPackagesInstalled(self):
+    self.vm._installed_packages.add('build_tools')
+    self.vm.InstallPackages.side_effect = (
+        errors.VirtualMachine.RemoteCommandError
+    )
+    with self.assertRaises(errors.VirtualMachine.RemoteCommandError):
+      with self.vm.BatchInstallPackages():
+        # What vm.Install('lua5_1') does inside a batch.
+        self.vm.QueueInstallPackages('lua5.1 liblua5.1-dev')
+        self.vm._installed_packages.add('lua5_1')
+    self.assertEqual(self.vm._installed_packages, {'build_tools'})
+
+
 class TestLsCpu(unittest.TestCase, test_util.SamplesTestMixin):
   LSCPU_DATA = {
       'NUMA node(s)': '1',
@@ -44,7 +44,9 @@ class AwsElasticacheRedisTestCase(pkb_common_test_case.PkbCommonTestCase):
     self.enter_context(
         mock.patch.object(self.redis, '_GetClientVm', return_value=mock_vm)
     )
-    self.mock_command = mock.patch.object(vm_util, 'IssueCommand').start()
+    self.mock_command = self.enter_context(
+        mock.patch.object(vm_util, 'IssueCommand')
+    )
 
   def testCreate(self):
     self.mock_command.return_value = (None, '', None)
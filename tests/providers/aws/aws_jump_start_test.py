@@ -115,23 +115,7 @@ class AwsJumpStartTest(pkb_common_test_case.PkbCommonTestCase):
     self.MockRunCommand(
         {
             'aws sagemaker list-endpoints': [(
-                ("""{
-    "Endpoints": [
-        {
-            "EndpointName": "woo-test",
-            "EndpointArn": "arn:aws:sagemaker:us-west-2:1234:endpoint/woo-test",
-            "CreationTime": "2024-08-19T18:33:34.178000+00:00",
-            "LastModifiedTime": "2024-08-19T18:33:34.521000+00:00",
-            "EndpointStatus": "Creating"
-        },
-        {
-            "EndpointName": "meta-7b-f-2024-08",
-            "EndpointArn": "arn:aws:sagemaker:us-west-2:1234:endpoint/meta-7b-f-2024-08",
-            "CreationTime": "2024-08-16T17:59:22.752000+00:00",
-            "LastModifiedTime": "2024-08-16T18:10:43.808000+00:00",
-            "EndpointStatus": "InService"
-        }
-        ]}"""),
+                'woo-test\tmeta-7b-f-2024-08\n',
                 '',
                 0,
             )]
@@ -145,7 +129,7 @@ class AwsJumpStartTest(pkb_common_test_case.PkbCommonTestCase):
     self.MockRunCommand(
         {
             'aws sagemaker list-endpoints': [(
-                """{"Endpoints": []}""",
+                '',
                 '',
                 0,
             )]
@@ -159,7 +143,7 @@ class AwsJumpStartTest(pkb_common_test_case.PkbCommonTestCase):
     self.MockRunCommand(
         {
             'aws sagemaker list-endpoints': [(
-                """{"Endpoints": []}""",
+                '',
                 '',
                 0,
             )]
@@ -168,7 +152,14 @@ class AwsJumpStartTest(pkb_common_test_case.PkbCommonTestCase):
     )
     self.ai_model.ListExistingEndpoints()
     self.ai_model.vm.RunCommand.assert_called_once_with(
-        command=['aws', 'sagemaker', 'list-endpoints', '--region=us-west-1'],
+        command=[
+            'aws',
+            'sagemaker',
+            'list-endpoints',
+            '--region=us-west-1',
+            '--query=Endpoints[].EndpointName',
+            '--output=text',
+        ],
     )
     self.assertEqual(self.ai_model.region, 'us-west-1')
 
@@ -176,7 +167,7 @@ class AwsJumpStartTest(pkb_common_test_case.PkbCommonTestCase):
     self.MockRunCommand(
         {
             'aws sagemaker list-endpoints': [(
-                """{"Endpoints": []}""",
+                '',
                 '',
                 0,
             )]
@@ -185,9 +176,43 @@ class AwsJumpStartTest(pkb_common_test_case.PkbCommonTestCase):
     )
     self.ai_model.ListExistingEndpoints('us-east-1')
     self.ai_model.vm.RunCommand.assert_called_once_with(
-        command=['aws', 'sagemaker', 'list-endpoints', '--region=us-east-1'],
+        command=[
+            'aws',
+            'sagemaker',
+            'list-endpoints',
+            '--region=us-east-1',
+            '--query=Endpoints[].EndpointName',
+            '--output=text',
+        ],
     )
 
+  def testDeleteUsesCliDirectly(self):
+    self.MockRunCommand(
+        {
+            'aws sagemaker describe-endpoint': [('endpoint-config\n', '', 0)],
+            'aws sagemaker delete-': [('', '', 0)],
+        },
+        self.ai_model.vm,
+    )
+    self.ai_model.endpoint_name = 'endpoint'
+    self.ai_model.model_name = 'model'
+    self.ai_model._Delete()
+    for command in [
+        ['aws', 'sagemaker', 'delete-model', '--model-name=model'],
+        ['aws', 'sagemaker', 'delete-endpoint', '--endpoint-name=endpoint'],
+        [
+            'aws',
+            'sagemaker',
+            'delete-endpoint-config',
+            '--endpoint-config-name=endpoint-config',
+        ],
+    ]:
+      self.ai_model.vm.RunCommand.assert_any_call(
+          command + ['--region=us-west-1'], ignore_failure=True
+      )
+    for call in self.ai_model.vm.RunCommand.call_args_list:
+      self.assertNotIn('python3', ' '.join(call.args[0]))
+
   def testPromptResponseParsed(self):
     expected_response = """ Assistant: Here's how you can travel from Beijing to New York:
 
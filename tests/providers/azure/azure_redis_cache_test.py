@@ -33,6 +33,7 @@ class AzureRedisCacheTestCase(pkb_common_test_case.PkbCommonTestCase):
     FLAGS.project = 'project'
     FLAGS.zones = ['eastus']
     FLAGS.cloud_redis_region = 'eastus'
+    FLAGS.run_uri = 'run12345'
     mock_spec = mock.Mock()
     mock_spec.version = 'redis_6_x'
     mock_resource_group = mock.Mock()
@@ -42,7 +43,9 @@ class AzureRedisCacheTestCase(pkb_common_test_case.PkbCommonTestCase):
     self.resource_group_patch.return_value = mock_resource_group
     mock_resource_group.name = 'az_resource'
     self.redis = azure_redis_cache.AzureRedisCache(mock_spec)
-    self.mock_command = mock.patch.object(vm_util, 'IssueCommand').start()
+    self.mock_command = self.enter_context(
+        mock.patch.object(vm_util, 'IssueCommand')
+    )
 
   def testCreate(self):
     self.mock_command.return_value = (None, '', None)
@@ -55,7 +58,7 @@ class AzureRedisCacheTestCase(pkb_common_test_case.PkbCommonTestCase):
         '--location',
         'eastus',
         '--name',
-        'pkb-None',
+        'pkb-run12345',
         '--sku',
         'Basic',
         '--vm-size',
@@ -76,7 +79,7 @@ class AzureRedisCacheTestCase(pkb_common_test_case.PkbCommonTestCase):
         '--resource-group',
         'az_resource',
         '--name',
-        'pkb-None',
+        'pkb-run12345',
         '--yes',
     ]
     self.redis._Delete()
@@ -91,7 +94,7 @@ class AzureRedisCacheTestCase(pkb_common_test_case.PkbCommonTestCase):
         '--resource-group',
         'az_resource',
         '--name',
-        'pkb-None',
+        'pkb-run12345',
     ]
     self.redis._Exists()
     self.mock_command.assert_called_once_with(
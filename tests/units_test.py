@@ -14,6 +14,7 @@
 
 """Tests for perfkitbenchmarker.units."""
 
+import copy
 import pickle
 import unittest
 
@@ -86,6 +87,25 @@ class TestPintPickling(unittest.TestCase):
     q = units.ParseExpression('10%')
     self.assertEqual(q, pickle.loads(pickle.dumps(q)))
 
+  def testUnpickledQuantitiesShareUnits(self):
+    first = pickle.loads(pickle.dumps(1.0 * units.megabyte / units.second))
+    second = pickle.loads(pickle.dumps(2.0 * units.megabyte / units.second))
+
+    self.assertEqual(str(first.units), 'megabyte / second')
+    self.assertIs(first._units, second._units)
+
+
+class TestUnitDeepCopy(unittest.TestCase):
+
+  def testUnitIsShared(self):
+    self.assertIs(copy.deepcopy(units.byte), units.byte)
+
+  def testQuantityIsCopied(self):
+    q = 5 * units.byte
+    q_copy = copy.deepcopy(q)
+    self.assertEqual(q, q_copy)
+    self.assertIsNot(q, q_copy)
+
 
 if __name__ == '__main__':
   unittest.main()
@@ -155,6 +155,10 @@ class IssueCommandTestCase(pkb_common_test_case.PkbCommonTestCase):
     _, _, retcode = vm_util.IssueCommand(['sleep', '0s'], timeout=None)
     self.assertEqual(retcode, 0)
 
+  def testStdinData(self):
+    stdout, _, _ = vm_util.IssueCommand(['cat'], stdin_data=b'hello')
+    self.assertEqual(stdout, 'hello')
+
   def testLogsInfo(self):
     with self.assertLogs(level='INFO') as logs:
       vm_util.IssueCommand(['sleep', '0s'])
@@ -258,6 +262,22 @@ class VmUtilTest(pkb_common_test_case.PkbCommonTestCase):
     self.assertEqual('a=b c=d', vm_util.DictionaryToEnvString(test_dict))
     self.assertEqual('a=b;c=d', vm_util.DictionaryToEnvString(test_dict, ';'))
 
+  def testRetryBacksOffToMaxPollInterval(self):
+    mock_sleep = self.enter_context(mock.patch.object(time, 'sleep'))
+    results = iter([ValueError()] * 5 + [True])
+
+    @vm_util.Retry(poll_interval=1, max_poll_interval=4, fuzz=0)
+    def Func():
+      result = next(results)
+      if isinstance(result, Exception):
+        raise result
+      return result
+
+    self.assertTrue(Func())
+    self.assertEqual(
+        [1, 2, 4, 4, 4], [c.args[0] for c in mock_sleep.call_args_list]
+    )
+
 
 if __name__ == '__main__':
   unittest.main()